@@ -8,27 +8,253 @@ SEC EDGAR 문서 분석기 (완전판)
 공식 문서: https://www.sec.gov/search-filings/edgar-application-programming-interfaces
 """
 
-import requests
+import asyncio
+import hashlib
+import heapq
+import httpx
+import io
 import json
+import msgspec
+import orjson
 import pandas as pd
-from typing import Dict, List, Optional
-from datetime import datetime
+from collections import OrderedDict
+from dataclasses import astuple, dataclass, fields
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import AsyncIterator, Dict, List, Optional, Type
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
 import time
 import re
+import threading
+from lxml import etree
+from lxml import html as lxml_html
 from pathlib import Path
+from tabulate import tabulate
+
+# Filing HTML 파서 (모듈 로드 시 한 번만 생성, 스레드 간에는 공유하지 않음)
+_FILING_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+# 텍스트 추출 시 제거할 요소 (XBRL 숨김 헤더, 스크립트, 스타일)
+_FILING_DROP_TAGS = ('ix:header', 'script', 'style')
+
+# 목차 링크/앵커에서 Item 번호 추출 (예: "Item 1A." → "1A", name="item7" → "7")
+_ITEM_LINK_RE = re.compile(r'^\s*item\s*(\d{1,2}[a-c]?)\b', re.IGNORECASE)
+_ITEM_ANCHOR_RE = re.compile(r'^item_?(\d{1,2}[a-c]?)$', re.IGNORECASE)
+
+
+def _parse_filing(html_content: str):
+    """
+    Filing HTML 파싱 후 텍스트 추출에 불필요한 요소 제거
+    
+    Args:
+        html_content: HTML 내용
+    
+    Returns:
+        lxml 문서 트리
+    """
+    # lxml(C) 파서로 한 번만 파싱 (XML 선언이 있는 iXBRL 문서도 처리하도록 bytes 입력)
+    tree = lxml_html.fromstring(html_content.encode('utf-8'), parser=_FILING_PARSER)
+    
+    # XBRL 헤더(숨겨진 팩트, 참조 정보)와 스크립트/스타일 제거 (뒤따르는 tail 텍스트는 유지)
+    etree.strip_elements(tree, *_FILING_DROP_TAGS, with_tail=False)
+    
+    return tree
+
+
+def _extract_text(html_content: str) -> str:
+    """
+    HTML Filing에서 텍스트 추출 (프로세스 풀에서 호출할 수 있도록 모듈 함수로 분리)
+    
+    Args:
+        html_content: HTML 내용
+    
+    Returns:
+        추출된 텍스트
+    """
+    tree = _parse_filing(html_content)
+    
+    # 태그 경계마다 공백을 두고, 여러 공백을 하나로
+    return ' '.join(' '.join(tree.itertext()).split())
+
+
+def _extract_sections(html_content: str) -> Dict[str, str]:
+    """
+    HTML Filing에서 Item별 섹션 텍스트 추출
+    
+    목차의 내부 링크(<a href="#...">Item 1A.</a> 또는 Item 번호가 적힌 목차 행의 링크)가
+    가리키는 요소나 <a name="item1a"> 형태의 앵커를 섹션 시작으로 보고,
+    문서를 한 번 순회하며 다음 섹션 시작 전까지의 텍스트를 해당 섹션에 모은다.
+    
+    Args:
+        html_content: HTML 내용
+    
+    Returns:
+        섹션 이름(예: "Item 1A") → 텍스트 딕셔너리
+    """
+    tree = _parse_filing(html_content)
+    
+    # 섹션 시작 요소의 id/name → 섹션 이름
+    targets: Dict[str, str] = {}
+    for link in tree.iter('a'):
+        href = link.get('href', '')
+        if href.startswith('#'):
+            # 링크 텍스트가 제목/페이지 번호뿐이면 같은 목차 행의 텍스트에서 Item 번호 확인
+            match = _ITEM_LINK_RE.match(link.text_content())
+            if not match:
+                row = next(link.iterancestors('tr'), None)
+                match = _ITEM_LINK_RE.match(row.text_content()) if row is not None else None
+            if match:
+                targets.setdefault(href[1:], f"Item {match.group(1).upper()}")
+        else:
+            match = _ITEM_ANCHOR_RE.match(link.get('name', ''))
+            if match:
+                targets.setdefault(link.get('name'), f"Item {match.group(1).upper()}")
+    
+    if not targets:
+        return {}
+    
+    chunks: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    
+    for event, node in etree.iterwalk(tree, events=('start', 'end')):
+        if event == 'start':
+            section = targets.get(node.get('id') or node.get('name') or '')
+            if section:
+                current = chunks.setdefault(section, [])
+            if current is not None and node.text:
+                current.append(node.text)
+        elif current is not None and node.tail:
+            current.append(node.tail)
+    
+    return {
+        section: ' '.join(' '.join(parts).split())
+        for section, parts in chunks.items()
+    }
 
 # =============================================================================
 # SEC EDGAR API 클라이언트
 # =============================================================================
 
+class _TokenBucket:
+    """
+    스레드/코루틴 간 공유되는 토큰 버킷 Rate limiter
+    
+    초당 refill_rate 개의 토큰을 채우고, 요청마다 토큰 1개를 소비한다.
+    토큰이 부족하면 다음 토큰이 채워질 때까지 대기한다.
+    """
+    
+    def __init__(self, capacity: int = 10, refill_rate: float = 10.0):
+        """
+        Args:
+            capacity: 버킷 최대 토큰 수 (버스트 허용량)
+            refill_rate: 초당 채워지는 토큰 수
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        토큰 1개를 예약
+        
+        Returns:
+            토큰을 사용하기 전까지 대기해야 하는 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+            self._updated = now
+            
+            # 토큰이 음수가 되면 이후 요청이 그만큼 더 기다림
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+    
+    def acquire(self) -> None:
+        """토큰 획득 (스레드용, 블로킹)"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def aacquire(self) -> None:
+        """토큰 획득 (코루틴용)"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def decrease(self, factor: float = 0.5, min_rate: float = 1.0) -> None:
+        """차단 응답 시 채우는 속도를 곱셈으로 감소 (AIMD)"""
+        with self._lock:
+            self.refill_rate = max(min_rate, self.refill_rate * factor)
+    
+    def increase(self, step: float = 0.1) -> None:
+        """성공 응답 시 채우는 속도를 덧셈으로 회복 (AIMD)"""
+        if self.refill_rate >= self.max_refill_rate:
+            return
+        with self._lock:
+            self.refill_rate = min(self.max_refill_rate, self.refill_rate + step)
+
+
+class SECRateLimitError(Exception):
+    """SEC 요청 한도 초과 (403 Request Rate Threshold Exceeded)"""
+
+
+class ConceptUnit(msgspec.Struct):
+    """companyconcept 응답의 단위별 보고 값 한 건"""
+    end: str
+    val: int | float
+    fy: Optional[int] = None
+    fp: Optional[str] = None
+    form: str = ''
+    filed: str = ''
+
+
+class CompanyConcept(msgspec.Struct):
+    """companyconcept 응답 (사용하는 필드만 디코딩)"""
+    label: Optional[str] = None
+    description: Optional[str] = None
+    units: Dict[str, List[ConceptUnit]] = {}
+
+
 class SECEdgarClient:
     """
-    SEC EDGAR 공식 API 클라이언트
+    SEC EDGAR 공식 API 클라이언트 (비동기)
     
     API 키 불필요하지만 User-Agent는 필수
     SEC 정책: https://www.sec.gov/os/accessing-edgar-data
+    
+    사용법:
+        async with SECEdgarClient("Sayouzone", "sjkim@sayouzone.com") as client:
+            cik = await client.get_company_cik("AAPL")
     """
     
+    # SEC 정책: 초당 10개 요청 제한 → 동시 요청도 10개로 제한
+    max_concurrency = 10
+    
+    # 모든 인스턴스가 공유하는 Rate limiter (초당 10개 요청)
+    _bucket = _TokenBucket(capacity=10, refill_rate=10.0)
+    
+    # 일시적 오류 재시도 (429, 5xx) - Retry-After 헤더 우선, 없으면 지수 백오프
+    max_retries = 5
+    backoff_factor = 0.2
+    retry_statuses = frozenset({429, 500, 502, 503, 504})
+    
+    # company_tickers.json 매핑 URL 및 디스크 캐시 위치
+    tickers_url = "https://www.sec.gov/files/company_tickers.json"
+    cache_dir = Path.home() / ".cache" / "sec_edgar"
+    
+    # 티커 → {cik, title} 역색인 (모든 인스턴스가 공유, 최초 조회 시 한 번만 구성)
+    _ticker_index: Optional[Dict[str, Dict]] = None
+    
+    # 당일 JSON 응답 메모리 캐시 크기
+    memo_maxsize = 64
+    
     def __init__(self, company_name: str, email: str):
         """
         Args:
@@ -36,22 +262,288 @@ class SECEdgarClient:
             email: 연락처 이메일
         """
         # SEC 요구사항: User-Agent 헤더 필수
+        # Accept-Encoding은 httpx가 설치된 디코더 기준으로 설정 (br, gzip, deflate)
         self.headers = {
-            'User-Agent': f'{company_name} {email}',
-            'Accept-Encoding': 'gzip, deflate'
+            'User-Agent': f'{company_name} {email}'
         }
         
         self.base_url = "https://data.sec.gov"
         self.edgar_url = "https://www.sec.gov/cgi-bin/browse-edgar"
         
-        # Rate limiting (초당 10개 요청 제한)
-        self.rate_limit_delay = 0.1
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # 티커 매핑 디스크 캐시 (동시 최초 조회 시 한 번만 로드)
+        self._tickers_path = self.cache_dir / "tickers.json"
+        self._tickers_meta_path = self.cache_dir / "tickers.meta.json"
+        self._ticker_lock = asyncio.Lock()
+        
+        # (URL, 날짜) → JSON 조회 Task (LRU, 동시 중복 요청도 하나로 합침)
+        self._memo: OrderedDict[tuple[str, str], asyncio.Task] = OrderedDict()
+    
+    async def __aenter__(self) -> "SECEdgarClient":
+        # 하나의 연결 풀을 유지하여 TCP/TLS 연결을 재사용 (HTTP keep-alive)
+        # HTTP/2로 동시 요청을 하나의 연결에 다중화, 연결 실패는 전송 계층에서 재시도
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+                keepalive_expiry=30.0
+            ),
+            http2=True,
+            retries=3
+        )
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            transport=transport,
+            follow_redirects=True
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """HTTP 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    @staticmethod
+    def _is_rate_limited(response: httpx.Response) -> bool:
+        """SEC 요청 한도 초과 응답 여부 (403 + 안내 페이지)"""
+        return (
+            response.status_code == httpx.codes.FORBIDDEN
+            and "Request Rate Threshold Exceeded" in response.text
+        )
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """
+        재시도 전 대기 시간 계산
+        
+        Args:
+            response: 실패한 응답
+            attempt: 지금까지의 재시도 횟수 (0부터)
+        
+        Returns:
+            대기 시간 (초)
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            # 초 단위 또는 HTTP 날짜 형식
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+        
+        return self.backoff_factor * (2 ** attempt)
+    
+    async def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        동시 요청 수를 제한하여 GET 요청
+        
+        429/5xx 응답은 Retry-After(없으면 지수 백오프)만큼 기다린 뒤 재시도하고,
+        SEC 차단(403 Request Rate Threshold Exceeded) 시에는 공유 Rate limiter의
+        속도를 절반으로 낮춘 뒤 재시도한다.
+        
+        Args:
+            url: 요청 URL
+            headers: 추가 요청 헤더 (조건부 요청 등)
+        
+        Returns:
+            HTTP 응답 (조건부 요청의 304 Not Modified 포함)
+        
+        Raises:
+            SECRateLimitError: 재시도 후에도 SEC 요청 한도 초과
+            httpx.HTTPStatusError: 그 외 오류 응답
+        """
+        if self._client is None:
+            raise RuntimeError("SECEdgarClient must be used with 'async with'")
+        
+        for attempt in range(self.max_retries + 1):
+            async with self._sem:
+                # Rate limiting 준수
+                await SECEdgarClient._bucket.aacquire()
+                response = await self._client.get(url, headers=headers)
+            
+            if self._is_rate_limited(response):
+                SECEdgarClient._bucket.decrease()
+                if attempt == self.max_retries:
+                    raise SECRateLimitError(f"SEC request rate threshold exceeded: {url}")
+            elif response.status_code not in self.retry_statuses or attempt == self.max_retries:
+                break
+            
+            await asyncio.sleep(self._retry_delay(response, attempt))
+        
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+        
+        SECEdgarClient._bucket.increase()
+        return response
+    
+    async def _fetch_json(self, url: str, path: Path, type: Optional[Type] = None):
+        """
+        디스크 캐시 또는 SEC에서 JSON 조회
+        
+        Args:
+            url: 요청 URL
+            path: 당일 디스크 캐시 파일 경로
+            type: 디코딩할 msgspec.Struct 타입 (없으면 딕셔너리)
+        
+        Returns:
+            JSON 딕셔너리 또는 type 인스턴스
+        """
+        decode = orjson.loads if type is None else msgspec.json.Decoder(type).decode
+        
+        try:
+            return decode(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError, msgspec.DecodeError):
+            pass
+        
+        response = await self._get(url)
+        data = decode(response.content)
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 이전 날짜의 캐시 파일 정리
+            for stale in path.parent.glob(f"{path.name.split('_')[0]}_*.json"):
+                stale.unlink(missing_ok=True)
+            path.write_bytes(response.content)
+        except OSError as e:
+            print(f"Error writing response cache: {e}")
+        
+        return data
+    
+    async def _get_json_cached(self, url: str, type: Optional[Type] = None):
+        """
+        당일 캐시를 거쳐 JSON 조회 (메모리 LRU → 디스크 → SEC)
+        
+        같은 날 같은 URL은 한 번만 요청하며, 동시에 들어온 같은 요청은
+        하나의 Task를 함께 기다린다.
+        
+        Args:
+            url: 요청 URL
+            type: 디코딩할 msgspec.Struct 타입 (없으면 딕셔너리)
+        
+        Returns:
+            JSON 딕셔너리 또는 type 인스턴스 (호출자 간에 공유되므로 수정하지 않음)
+        """
+        today = date.today().isoformat()
+        key = (url, today)
+        
+        task = self._memo.get(key)
+        if task is None:
+            digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+            path = self.cache_dir / "responses" / f"{digest}_{today}.json"
+            task = asyncio.ensure_future(self._fetch_json(url, path, type))
+            self._memo[key] = task
+            if len(self._memo) > self.memo_maxsize:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(key)
+        
+        try:
+            return await task
+        except Exception:
+            # 실패한 요청은 캐시하지 않음
+            if self._memo.get(key) is task:
+                del self._memo[key]
+            raise
+    
+    def _read_ticker_cache(self) -> tuple[Optional[Dict[str, Dict]], Dict[str, str]]:
+        """
+        디스크에 캐시된 티커 매핑과 검증 정보(ETag, Last-Modified) 로드
+        
+        Returns:
+            (티커 매핑 또는 None, 검증 정보 딕셔너리)
+        """
+        try:
+            index = json.loads(self._tickers_path.read_text(encoding="utf-8"))
+            meta = json.loads(self._tickers_meta_path.read_text(encoding="utf-8"))
+            return index, meta
+        except (OSError, ValueError):
+            return None, {}
+    
+    def _write_ticker_cache(self, index: Dict[str, Dict], response: httpx.Response) -> None:
+        """
+        티커 매핑과 검증 정보를 디스크에 저장
+        
+        Args:
+            index: 티커 매핑
+            response: company_tickers.json 응답
+        """
+        meta = {
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+        }
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._tickers_path.write_text(json.dumps(index), encoding="utf-8")
+            self._tickers_meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        except OSError as e:
+            print(f"Error writing ticker cache: {e}")
     
-    def _rate_limit(self):
-        """Rate limiting 준수"""
-        time.sleep(self.rate_limit_delay)
+    async def _load_ticker_index(self) -> Dict[str, Dict]:
+        """
+        티커 → {cik, title} 매핑 로드
+        
+        디스크 캐시가 있으면 If-None-Match / If-Modified-Since 조건부 요청을 보내고,
+        304 Not Modified 응답이면 캐시를 그대로 사용한다.
+        
+        Returns:
+            대문자 티커를 키로 하는 매핑 딕셔너리
+        """
+        if SECEdgarClient._ticker_index is not None:
+            return SECEdgarClient._ticker_index
+        
+        async with self._ticker_lock:
+            # 대기 중 다른 코루틴이 이미 로드했으면 그대로 사용
+            if SECEdgarClient._ticker_index is None:
+                SECEdgarClient._ticker_index = await self._fetch_ticker_index()
+        
+        return SECEdgarClient._ticker_index
+    
+    async def _fetch_ticker_index(self) -> Dict[str, Dict]:
+        """
+        디스크 캐시 검증 또는 SEC에서 티커 매핑을 받아 역색인 구성
+        
+        Returns:
+            대문자 티커를 키로 하는 매핑 딕셔너리
+        """
+        cached, meta = self._read_ticker_cache()
+        
+        headers = {}
+        if cached is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        
+        response = await self._get(self.tickers_url, headers=headers)
+        
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            index = cached
+        else:
+            data = orjson.loads(response.content)
+            
+            # CIK를 10자리로 패딩하여 티커 기준으로 역색인 (중복 티커는 먼저 나온 회사 우선)
+            index = {}
+            for company in data.values():
+                index.setdefault(company['ticker'].upper(), {
+                    'cik': str(company['cik_str']).zfill(10),
+                    'title': company['title'],
+                })
+            self._write_ticker_cache(index, response)
+        
+        return index
     
-    def get_company_cik(self, ticker: str) -> Optional[str]:
+    async def get_company_cik(self, ticker: str) -> Optional[str]:
         """
         티커 심볼로 CIK 번호 조회
         
@@ -61,24 +553,16 @@ class SECEdgarClient:
         Returns:
             CIK 번호 (10자리)
         """
-        # CIK 매핑 파일 다운로드
-        # 회사이름, 티커, CIK
-        url = "https://www.sec.gov/files/company_tickers.json"
-        
+        # CIK 매핑 파일 (회사이름, 티커, CIK) - 디스크 캐시 사용
         try:
-            self._rate_limit()
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            data = response.json()
+            index = await self._load_ticker_index()
             
             # 티커로 CIK 찾기
-            for key, company in data.items():
-                if company['ticker'].upper() == ticker.upper():
-                    # CIK를 10자리로 패딩
-                    cik = str(company['cik_str']).zfill(10)
-                    print(f"✓ Found: {company['title']} (CIK: {cik})")
-                    return cik
+            company = index.get(ticker.upper())
+            if company:
+                cik = company['cik']
+                print(f"✓ Found: {company['title']} (CIK: {cik})")
+                return cik
             
             print(f"✗ Ticker '{ticker}' not found")
             return None
@@ -87,7 +571,7 @@ class SECEdgarClient:
             print(f"Error getting CIK: {e}")
             return None
     
-    def get_submissions(self, cik: str) -> Dict:
+    async def get_submissions(self, cik: str) -> Dict:
         """
         회사의 모든 제출 문서 조회
         
@@ -103,17 +587,13 @@ class SECEdgarClient:
         url = f"{self.base_url}/submissions/CIK{cik}.json"
         
         try:
-            self._rate_limit()
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            return response.json()
+            return await self._get_json_cached(url)
         
         except Exception as e:
             print(f"Error getting submissions: {e}")
             return {}
     
-    def get_company_facts(self, cik: str) -> Dict:
+    async def get_company_facts(self, cik: str) -> Dict:
         """
         회사의 재무 팩트 조회 (XBRL 데이터)
         
@@ -128,49 +608,106 @@ class SECEdgarClient:
         url = f"{self.base_url}/api/xbrl/companyfacts/CIK{cik}.json"
         
         try:
-            self._rate_limit()
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            return response.json()
+            return await self._get_json_cached(url)
         
         except Exception as e:
             print(f"Error getting company facts: {e}")
             return {}
     
-    def get_company_concept(
+    async def get_company_concept(
         self,
         cik: str,
         taxonomy: str = "us-gaap",
         concept: str = "AccountsPayableCurrent"
-    ) -> Dict:
+    ) -> Optional[CompanyConcept]:
         """
         특정 개념의 데이터 조회
         
+        응답은 CompanyConcept로 바로 디코딩되어 형태가 한 번에 검증된다.
+        
         Args:
             cik: CIK 번호
             taxonomy: XBRL taxonomy (us-gaap, ifrs-full, dei, srt)
             concept: 개념 이름
         
         Returns:
-            개념 데이터 딕셔너리
+            개념 데이터 (조회 실패 시 None)
         """
         cik = str(cik).zfill(10)
         
         url = f"{self.base_url}/api/xbrl/companyconcept/CIK{cik}/{taxonomy}/{concept}.json"
         
         try:
-            self._rate_limit()
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            return response.json()
+            return await self._get_json_cached(url, CompanyConcept)
+        
+        except httpx.HTTPStatusError as e:
+            # 회사가 보고하지 않은 개념은 404
+            if e.response.status_code != httpx.codes.NOT_FOUND:
+                print(f"Error getting company concept: {e}")
+            return None
         
         except Exception as e:
             print(f"Error getting company concept: {e}")
-            return {}
+            return None
+    
+    async def iter_filing_chunks(
+        self,
+        accession_number: str,
+        cik: str,
+        primary_document: str,
+        chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Filing 문서를 청크 단위로 스트리밍
+        
+        응답 본문 전체를 메모리에 올리지 않고 받는 대로 넘겨주므로
+        수신과 파싱/저장을 겹칠 수 있다. 재시도 정책은 _get과 동일하다.
+        
+        Args:
+            accession_number: Accession number
+            cik: CIK 번호
+            primary_document: 주 문서 파일명
+            chunk_size: 청크 크기 (바이트)
+        
+        Yields:
+            문서 본문 바이트 청크
+        
+        Raises:
+            SECRateLimitError: 재시도 후에도 SEC 요청 한도 초과
+            httpx.HTTPStatusError: 그 외 오류 응답
+        """
+        if self._client is None:
+            raise RuntimeError("SECEdgarClient must be used with 'async with'")
+        
+        cik = str(cik).zfill(10)
+        
+        # Accession number 포맷팅 (하이픈 제거)
+        acc_no = accession_number.replace("-", "")
+        
+        url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{acc_no}/{primary_document}"
+        
+        for attempt in range(self.max_retries + 1):
+            async with self._sem:
+                # Rate limiting 준수
+                await SECEdgarClient._bucket.aacquire()
+                async with self._client.stream("GET", url) as response:
+                    if response.status_code == httpx.codes.FORBIDDEN:
+                        # 차단 안내 페이지 확인을 위해 본문 수신
+                        await response.aread()
+                    if self._is_rate_limited(response):
+                        SECEdgarClient._bucket.decrease()
+                        if attempt == self.max_retries:
+                            raise SECRateLimitError(f"SEC request rate threshold exceeded: {url}")
+                    elif response.status_code not in self.retry_statuses or attempt == self.max_retries:
+                        response.raise_for_status()
+                        SECEdgarClient._bucket.increase()
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            yield chunk
+                        return
+            
+            await asyncio.sleep(self._retry_delay(response, attempt))
     
-    def download_filing(
+    async def download_filing(
         self,
         accession_number: str,
         cik: str,
@@ -187,36 +724,102 @@ class SECEdgarClient:
         Returns:
             문서 HTML 내용
         """
+        try:
+            # 스트리밍으로 받아 한 번만 디코딩 (응답 객체에 bytes/str 사본을 함께 보관하지 않음)
+            chunks = [
+                chunk
+                async for chunk in self.iter_filing_chunks(accession_number, cik, primary_document)
+            ]
+            return b"".join(chunks).decode("utf-8", errors="replace")
+        
+        except Exception as e:
+            print(f"Error downloading filing: {e}")
+            return None
+    
+    async def download_financial_report(
+        self,
+        accession_number: str,
+        cik: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Filing의 Financial Report(재무제표 엑셀) 다운로드
+        
+        SEC가 XBRL Filing마다 생성하는 Financial_Report.xlsx를 받아
+        재무제표별 시트를 DataFrame으로 읽는다. 전체 HTML 문서를 받아
+        텍스트를 추출하지 않고도 재무제표 수치를 얻을 수 있다.
+        
+        Args:
+            accession_number: Accession number
+            cik: CIK 번호
+        
+        Returns:
+            시트 이름 → DataFrame 딕셔너리
+        """
         cik = str(cik).zfill(10)
         
         # Accession number 포맷팅 (하이픈 제거)
         acc_no = accession_number.replace("-", "")
         
-        url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{acc_no}/{primary_document}"
+        url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{acc_no}/Financial_Report.xlsx"
         
         try:
-            self._rate_limit()
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
+            response = await self._get(url)
             
-            return response.text
+            # Rust 기반 calamine 엔진으로 모든 시트 읽기 (이벤트 루프 밖에서)
+            return await asyncio.to_thread(
+                pd.read_excel,
+                io.BytesIO(response.content),
+                sheet_name=None,
+                engine='calamine'
+            )
         
         except Exception as e:
-            print(f"Error downloading filing: {e}")
-            return None
+            print(f"Error downloading financial report: {e}")
+            return {}
 
 
 # =============================================================================
 # SEC Filing 분석기
 # =============================================================================
 
+@dataclass(slots=True)
+class FinancialMetric:
+    """주요 재무 지표 한 건 (최신 값)"""
+    metric: str
+    value: object
+    date: str
+    form: str
+    description: str
+    
+    @staticmethod
+    def headers() -> List[str]:
+        """출력용 컬럼 이름"""
+        return [f.name.capitalize() for f in fields(FinancialMetric)]
+    
+    @staticmethod
+    def to_dataframe(metrics: List["FinancialMetric"]) -> pd.DataFrame:
+        """
+        재무 지표 리스트를 DataFrame으로 변환
+        
+        Args:
+            metrics: 재무 지표 리스트
+        
+        Returns:
+            재무 지표 DataFrame (Metric, Value, Date, Form, Description)
+        """
+        return pd.DataFrame(
+            [astuple(m) for m in metrics],
+            columns=FinancialMetric.headers()
+        )
+
+
 class SECFilingAnalyzer:
     """SEC Filing 문서 분석기"""
     
     def __init__(self, client: SECEdgarClient):
         self.client = client
     
-    def get_recent_filings(
+    async def get_recent_filings(
         self,
         cik: str,
         form_type: Optional[str] = None,
@@ -233,14 +836,14 @@ class SECFilingAnalyzer:
         Returns:
             Filing 정보 DataFrame
         """
-        submissions = self.client.get_submissions(cik)
+        submissions = await self.client.get_submissions(cik)
         
         if not submissions:
             return pd.DataFrame()
         
         recent = submissions.get('filings', {}).get('recent', {})
         
-        # DataFrame 생성
+        # DataFrame 생성 (form은 category, accessionNumber는 string으로 저장)
         df = pd.DataFrame({
             'accessionNumber': recent.get('accessionNumber', []),
             'filingDate': recent.get('filingDate', []),
@@ -248,37 +851,59 @@ class SECFilingAnalyzer:
             'form': recent.get('form', []),
             'primaryDocument': recent.get('primaryDocument', []),
             'primaryDocDescription': recent.get('primaryDocDescription', []),
-        })
+        }).astype({'accessionNumber': 'string', 'form': 'category'})
+        
+        # 날짜는 datetime64로 변환 (reportDate는 빈 문자열이 있을 수 있음)
+        for col in ('filingDate', 'reportDate'):
+            df[col] = pd.to_datetime(df[col], format='%Y-%m-%d', errors='coerce')
         
         # Form type 필터링
         if form_type:
             df = df[df['form'] == form_type]
         
-        # 날짜순 정렬
-        df = df.sort_values('filingDate', ascending=False)
-        
-        return df.head(limit)
+        # 최근 limit개만 선택 (전체 정렬 대신 O(n log k))
+        return df.nlargest(limit, 'filingDate')
     
-    def extract_financial_metrics(self, cik: str) -> pd.DataFrame:
+    async def get_financial_statements(
+        self,
+        cik: str,
+        form_type: str = "10-K"
+    ) -> Dict[str, pd.DataFrame]:
         """
-        주요 재무 지표 추출
+        최근 Filing의 재무제표 조회 (Financial Report 사용)
         
         Args:
             cik: CIK 번호
+            form_type: Filing 타입 (10-K, 10-Q 등)
         
         Returns:
-            재무 지표 DataFrame
+            시트 이름 → 재무제표 DataFrame 딕셔너리
         """
-        facts = self.client.get_company_facts(cik)
+        filings = await self.get_recent_filings(cik, form_type=form_type, limit=1)
         
-        if not facts:
-            return pd.DataFrame()
+        if filings.empty:
+            return {}
         
-        metrics = []
+        filing = filings.iloc[0]
+        
+        return await self.client.download_financial_report(
+            accession_number=filing['accessionNumber'],
+            cik=cik
+        )
+    
+    async def extract_financial_metrics(self, cik: str) -> List[FinancialMetric]:
+        """
+        주요 재무 지표 추출
         
-        # US-GAAP 데이터 추출
-        us_gaap = facts.get('facts', {}).get('us-gaap', {})
+        결과가 몇 행뿐이므로 DataFrame 대신 FinancialMetric 리스트로 반환한다.
+        DataFrame이 필요하면 FinancialMetric.to_dataframe()을 사용한다.
         
+        Args:
+            cik: CIK 번호
+        
+        Returns:
+            재무 지표 리스트
+        """
         # 주요 지표 목록
         important_metrics = [
             'Assets',
@@ -290,30 +915,92 @@ class SECFilingAnalyzer:
             'CashAndCashEquivalentsAtCarryingValue'
         ]
         
-        for metric in important_metrics:
-            if metric in us_gaap:
-                data = us_gaap[metric]
-                label = data.get('label', metric)
-                description = data.get('description', '')
-                
-                # USD 단위 데이터 추출
-                units = data.get('units', {}).get('USD', [])
+        # 전체 companyfacts 대신 지표별 companyconcept만 동시에 조회
+        concepts = await asyncio.gather(*(
+            self.client.get_company_concept(cik, taxonomy="us-gaap", concept=metric)
+            for metric in important_metrics
+        ))
+        
+        metrics = []
+        
+        for metric, data in zip(important_metrics, concepts):
+            if not data:
+                continue
+            
+            label = data.label or metric
+            description = data.description or ''
+            
+            # USD 단위 데이터 추출
+            units = data.units.get('USD', [])
+            
+            if units:
+                # 가장 최근 값
+                latest = max(units, key=attrgetter('end'))
                 
-                if units:
-                    # 가장 최근 값
-                    latest = sorted(units, key=lambda x: x.get('end', ''), reverse=True)[0]
-                    
-                    metrics.append({
-                        'Metric': label,
-                        'Value': latest.get('val', 'N/A'),
-                        'Date': latest.get('end', 'N/A'),
-                        'Form': latest.get('form', 'N/A'),
-                        'Description': description[:100]
-                    })
-        
-        return pd.DataFrame(metrics)
-    
-    def analyze_revenue_trend(self, cik: str) -> pd.DataFrame:
+                metrics.append(FinancialMetric(
+                    metric=label,
+                    value=latest.val,
+                    date=latest.end,
+                    form=latest.form or 'N/A',
+                    description=description[:100]
+                ))
+        
+        return metrics
+    
+    async def extract_all_metrics(self, cik: str) -> pd.DataFrame:
+        """
+        모든 us-gaap 지표의 최신 값 추출
+
+        companyfacts 전체를 한 번 받아 긴 형식(long format) 테이블로 펼친 뒤,
+        한 번의 정렬과 중복 제거로 지표별 최신 행을 구한다.
+        주요 지표 몇 개만 필요하면 extract_financial_metrics가 더 가볍다.
+
+        Args:
+            cik: CIK 번호
+
+        Returns:
+            지표별 최신 값 DataFrame (Concept, Metric, Value, Date, Form)
+        """
+        facts = await self.client.get_company_facts(cik)
+
+        us_gaap = facts.get('facts', {}).get('us-gaap', {}) if facts else {}
+
+        # 지표별 dict 대신 열 단위 리스트로 한 번에 펼침
+        concepts, labels, values, dates, forms = [], [], [], [], []
+
+        for concept, data in us_gaap.items():
+            label = data.get('label') or concept
+
+            # USD 단위 데이터만 사용
+            for unit in data.get('units', {}).get('USD', []):
+                concepts.append(concept)
+                labels.append(label)
+                values.append(unit.get('val'))
+                dates.append(unit.get('end'))
+                forms.append(unit.get('form'))
+
+        if not concepts:
+            return pd.DataFrame()
+
+        df = pd.DataFrame({
+            'Concept': pd.Categorical(concepts),
+            'Metric': labels,
+            'Value': values,
+            'Date': dates,
+            'Form': pd.Categorical(forms),
+        })
+
+        # ISO 날짜 문자열은 사전순 = 시간순이므로 내림차순 정렬 후 지표별 첫 행만 유지
+        latest = (
+            df.sort_values('Date', ascending=False, kind='stable')
+              .drop_duplicates('Concept')
+              .sort_values('Concept')
+              .reset_index(drop=True)
+        )
+
+        return latest
+
+    async def analyze_revenue_trend(self, cik: str) -> pd.DataFrame:
         """
         매출 추이 분석
         
@@ -323,7 +1010,7 @@ class SECFilingAnalyzer:
         Returns:
             매출 추이 DataFrame
         """
-        revenue_data = self.client.get_company_concept(
+        revenue_data = await self.client.get_company_concept(
             cik=cik,
             taxonomy="us-gaap",
             concept="Revenues"
@@ -333,23 +1020,25 @@ class SECFilingAnalyzer:
             return pd.DataFrame()
         
         # USD 단위 데이터 추출
-        units = revenue_data.get('units', {}).get('USD', [])
+        units = revenue_data.units.get('USD', [])
         
         if not units:
             return pd.DataFrame()
         
-        # DataFrame 생성
-        df = pd.DataFrame(units)
+        # 최근 20개만 선택 (전체 정렬 없이 O(n log k))
+        latest = heapq.nlargest(20, units, key=attrgetter('end'))
         
-        # 필요한 컬럼만 선택
-        cols = ['end', 'val', 'fy', 'fp', 'form', 'filed']
-        df = df[[col for col in cols if col in df.columns]]
-        
-        # 날짜순 정렬
-        if 'end' in df.columns:
-            df = df.sort_values('end', ascending=False)
+        # 필요한 컬럼만 타입을 지정해 열 단위로 구성 (dict 리스트 → DataFrame 변환 및 컬럼 재선택 생략)
+        df = pd.DataFrame({
+            'end': pd.to_datetime([u.end for u in latest], format='%Y-%m-%d', errors='coerce'),
+            'val': pd.array([u.val for u in latest], dtype='Int64'),
+            'fy': pd.array([u.fy for u in latest], dtype='Int16'),
+            'fp': pd.Categorical([u.fp for u in latest]),
+            'form': pd.Categorical([u.form for u in latest]),
+            'filed': pd.to_datetime([u.filed for u in latest], format='%Y-%m-%d', errors='coerce'),
+        })
         
-        return df.head(20)
+        return df
     
     def extract_text_from_filing(self, html_content: str) -> str:
         """
@@ -361,45 +1050,97 @@ class SECFilingAnalyzer:
         Returns:
             추출된 텍스트
         """
-        # 간단한 HTML 태그 제거
-        text = re.sub(r'<[^>]+>', ' ', html_content)
+        return _extract_text(html_content)
+    
+    def extract_sections(self, html_content: str) -> Dict[str, str]:
+        """
+        HTML Filing에서 Item별 섹션 텍스트 추출
         
-        # 여러 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
+        Args:
+            html_content: HTML 내용
         
-        # XBRL 태그 제거
-        text = re.sub(r'</?ix:[^>]+>', '', text)
+        Returns:
+            섹션 이름(예: "Item 1A", "Item 7") → 텍스트 딕셔너리
+        """
+        return _extract_sections(html_content)
+    
+    async def extract_filing_texts(
+        self,
+        cik: str,
+        filings: pd.DataFrame,
+        max_workers: int = 4
+    ) -> Dict[str, str]:
+        """
+        여러 Filing을 다운로드하면서 동시에 텍스트 추출
+        
+        다운로드(네트워크 I/O)는 이벤트 루프에서, 텍스트 추출(CPU)은 프로세스 풀에서
+        실행하고 asyncio.Queue로 연결하여 두 작업을 겹쳐서 처리한다.
         
-        return text.strip()
+        Args:
+            cik: CIK 번호
+            filings: get_recent_filings() 결과 DataFrame
+            max_workers: 텍스트 추출 프로세스 수 (큐 크기)
+        
+        Returns:
+            Accession number → 추출된 텍스트 딕셔너리
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_workers)
+        loop = asyncio.get_running_loop()
+        texts: Dict[str, str] = {}
+        
+        async def download(filing) -> None:
+            html_content = await self.client.download_filing(
+                accession_number=filing.accessionNumber,
+                cik=cik,
+                primary_document=filing.primaryDocument
+            )
+            if html_content:
+                await queue.put((filing.accessionNumber, html_content))
+        
+        async def produce() -> None:
+            await asyncio.gather(*(download(f) for f in filings.itertuples(index=False)))
+            # 소비자 종료 신호
+            for _ in range(max_workers):
+                await queue.put(None)
+        
+        async def consume(pool: ProcessPoolExecutor) -> None:
+            while (item := await queue.get()) is not None:
+                accession_number, html_content = item
+                try:
+                    texts[accession_number] = await loop.run_in_executor(
+                        pool, _extract_text, html_content
+                    )
+                except Exception as e:
+                    print(f"Error extracting text ({accession_number}): {e}")
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            await asyncio.gather(produce(), *(consume(pool) for _ in range(max_workers)))
+        
+        return texts
 
 
 # =============================================================================
 # 사용 예제
 # =============================================================================
 
-def example_basic_usage(ticker: str):
+async def example_basic_usage(client: SECEdgarClient, ticker: str):
     """
     기본 사용 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
         ticker: 티커
     """
     print("\n" + "=" * 70)
     print("예제 1: 기본 사용법")
     print("=" * 70)
     
-    # 클라이언트 생성
-    client = SECEdgarClient(
-        company_name="Sayouzone",
-        email="sjkim@sayouzone.com"
-    )
-    
     # 티커로 CIK 조회
-    cik = client.get_company_cik(ticker)
+    cik = await client.get_company_cik(ticker)
     
     if cik:
         # 제출 문서 조회
-        submissions = client.get_submissions(cik)
+        submissions = await client.get_submissions(cik)
         
         print(f"\n회사명: {submissions.get('name')}")
         print(f"CIK: {submissions.get('cik')}")
@@ -410,25 +1151,25 @@ def example_basic_usage(ticker: str):
     print()
 
 
-def example_recent_filings(ticker: str):
+async def example_recent_filings(client: SECEdgarClient, ticker: str):
     """
     최근 Filing 조회 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
         ticker: 티커
     """
     print("\n" + "=" * 70)
     print("예제 2: 최근 Filing 조회")
     print("=" * 70)
     
-    client = SECEdgarClient("Sayouzone", "sjkim@sayouzone.com")
     analyzer = SECFilingAnalyzer(client)
     
-    cik = client.get_company_cik(ticker)
+    cik = await client.get_company_cik(ticker)
     
     if cik:
         # 최근 10-K 문서
-        filings = analyzer.get_recent_filings(cik, form_type="10-K", limit=5)
+        filings = await analyzer.get_recent_filings(cik, form_type="10-K", limit=5)
         
         print(f"\n최근 10-K Filings ({len(filings)} 개):")
         print(filings[['filingDate', 'form', 'primaryDocDescription']].to_string(index=False))
@@ -436,52 +1177,52 @@ def example_recent_filings(ticker: str):
     print()
 
 
-def example_financial_metrics(ticker: str):
+async def example_financial_metrics(client: SECEdgarClient, ticker: str):
     """
     재무 지표 분석 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
         ticker: 티커
     """
     print("\n" + "=" * 70)
     print("예제 3: 재무 지표 분석")
     print("=" * 70)
     
-    client = SECEdgarClient("Sayouzone", "sjkim@sayouzone.com")
     analyzer = SECFilingAnalyzer(client)
     
-    cik = client.get_company_cik(ticker)
+    cik = await client.get_company_cik(ticker)
     
     if cik:
         # 재무 지표 추출
-        metrics = analyzer.extract_financial_metrics(cik)
+        metrics = await analyzer.extract_financial_metrics(cik)
         
-        if not metrics.empty:
+        if metrics:
             print(f"\n주요 재무 지표:")
-            print(metrics.to_string(index=False))
+            print(tabulate([astuple(m) for m in metrics], headers=FinancialMetric.headers()))
     
     print()
 
 
-def example_revenue_trend(ticker: str):
+async def example_revenue_trend(client: SECEdgarClient, ticker: str):
     """
     매출 추이 분석 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
          ticker: 티커
     """
     print("\n" + "=" * 70)
     print("예제 4: 매출 추이 분석")
     print("=" * 70)
     
-    client = SECEdgarClient("Sayouzone", "sjkim@sayouzone.com")
     analyzer = SECFilingAnalyzer(client)
     
-    cik = client.get_company_cik(ticker)
+    cik = await client.get_company_cik(ticker)
     
     if cik:
         # 매출 추이
-        revenue = analyzer.analyze_revenue_trend(cik)
+        revenue = await analyzer.analyze_revenue_trend(cik)
         
         if not revenue.empty:
             print(f"\n매출 추이 (최근 10개):")
@@ -490,33 +1231,33 @@ def example_revenue_trend(ticker: str):
     print()
 
 
-def example_download_filing(ticker: str):
+async def example_download_filing(client: SECEdgarClient, ticker: str):
     """
     Filing 문서 다운로드 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
         ticker: 티커
     """
     print("\n" + "=" * 70)
     print("예제 5: Filing 문서 다운로드")
     print("=" * 70)
     
-    client = SECEdgarClient("Sayouzone", "sjkim@sayouzone.com")
     analyzer = SECFilingAnalyzer(client)
     
-    cik = client.get_company_cik(ticker)
+    cik = await client.get_company_cik(ticker)
     
     if cik:
         # 최근 10-K 가져오기
-        filings = analyzer.get_recent_filings(cik, form_type="10-K", limit=1)
+        filings = await analyzer.get_recent_filings(cik, form_type="10-K", limit=1)
         
         if not filings.empty:
             filing = filings.iloc[0]
             
-            print(f"\n다운로드 중: {filing['form']} ({filing['filingDate']})")
+            print(f"\n다운로드 중: {filing['form']} ({filing['filingDate']:%Y-%m-%d})")
             
             # 문서 다운로드
-            html_content = client.download_filing(
+            html_content = await client.download_filing(
                 accession_number=filing['accessionNumber'],
                 cik=cik,
                 primary_document=filing['primaryDocument']
@@ -529,43 +1270,89 @@ def example_download_filing(ticker: str):
                 print(f"문서 크기: {len(html_content)} 문자")
                 print(f"추출된 텍스트: {len(text)} 문자")
                 print(f"\n내용 미리보기:\n{text[:500]}...")
+                
+                # Item별 섹션 추출 (Risk Factors, MD&A 등)
+                sections = analyzer.extract_sections(html_content)
+                
+                print(f"\n추출된 섹션: {', '.join(sections) or '없음'}")
+                for name in ('Item 1A', 'Item 7'):
+                    if name in sections:
+                        print(f"{name}: {len(sections[name])} 문자 - {sections[name][:100]}...")
     
     print()
 
 
-def example_compare_companies(tickers: list[str]):
+async def _compare_one(
+    client: SECEdgarClient,
+    analyzer: SECFilingAnalyzer,
+    ticker: str
+) -> Optional[Dict]:
+    """
+    회사 간 비교를 위한 단일 티커 분석
+    
+    Args:
+        client: SEC EDGAR API 클라이언트
+        analyzer: SEC Filing 분석기
+        ticker: 티커
+    
+    Returns:
+        비교 행 딕셔너리 (티커를 찾지 못하면 None)
+    """
+    cik = await client.get_company_cik(ticker)
+    
+    if not cik:
+        return None
+    
+    submissions, metrics = await asyncio.gather(
+        client.get_submissions(cik),
+        analyzer.extract_financial_metrics(cik)
+    )
+    
+    # 자산 정보 찾기 (정확히 'Assets' 지표만, 'Net Assets' 등 제외)
+    assets = next((m for m in metrics if m.metric == 'Assets'), None)
+    
+    return {
+        'Ticker': ticker,
+        'Company': submissions.get('name'),
+        'Assets': assets.value if assets else 'N/A',
+        'Assets Date': assets.date if assets else 'N/A'
+    }
+
+
+async def example_compare_companies(
+    client: SECEdgarClient,
+    tickers: list[str],
+    max_workers: int = 4
+):
     """
     회사 간 비교 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
         tickers: 티커 리스트
+        max_workers: 동시에 분석할 최대 티커 수
     """
     print("\n" + "=" * 70)
     print("예제 6: 회사 간 비교")
     print("=" * 70)
     
-    client = SECEdgarClient("Sayouzone", "sjkim@sayouzone.com")
     analyzer = SECFilingAnalyzer(client)
     
     companies = tickers
-    results = []
     
-    for ticker in companies:
-        cik = client.get_company_cik(ticker)
-        
-        if cik:
-            submissions = client.get_submissions(cik)
-            metrics = analyzer.extract_financial_metrics(cik)
-            
-            # 자산 정보 찾기
-            assets_row = metrics[metrics['Metric'].str.contains('Assets', na=False)]
-            
-            results.append({
-                'Ticker': ticker,
-                'Company': submissions.get('name'),
-                'Assets': assets_row.iloc[0]['Value'] if not assets_row.empty else 'N/A',
-                'Assets Date': assets_row.iloc[0]['Date'] if not assets_row.empty else 'N/A'
-            })
+    # 동시에 진행되는 티커 수 제한 (전체 요청 속도는 공유 토큰 버킷이 제한)
+    workers = asyncio.Semaphore(max_workers)
+    
+    async def analyze(ticker: str) -> Optional[Dict]:
+        async with workers:
+            return await _compare_one(client, analyzer, ticker)
+    
+    # 티커별 분석을 동시에 실행 (입력 순서 유지)
+    results = [
+        result
+        for result in await asyncio.gather(*(analyze(t) for t in companies))
+        if result
+    ]
     
     df = pd.DataFrame(results)
     print(f"\n회사 비교:")
@@ -574,25 +1361,25 @@ def example_compare_companies(tickers: list[str]):
     print()
 
 
-def example_save_to_file(ticker: str):
+async def example_save_to_file(client: SECEdgarClient, ticker: str):
     """
     파일 저장 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
         ticker: 티커
     """
     print("\n" + "=" * 70)
     print("예제 7: 데이터 파일 저장")
     print("=" * 70)
     
-    client = SECEdgarClient("Sayouzone", "sjkim@sayouzone.com")
     analyzer = SECFilingAnalyzer(client)
     
-    cik = client.get_company_cik(ticker)
+    cik = await client.get_company_cik(ticker)
     
     if cik:
         # 최근 Filing 조회
-        filings = analyzer.get_recent_filings(cik, limit=20)
+        filings = await analyzer.get_recent_filings(cik, limit=20)
         
         # CSV로 저장
         output_file = "sec_filings_NVDA.csv"
@@ -602,11 +1389,11 @@ def example_save_to_file(ticker: str):
         print(f"  {len(filings)} filings saved")
         
         # 재무 지표 저장
-        metrics = analyzer.extract_financial_metrics(cik)
+        metrics = await analyzer.extract_financial_metrics(cik)
         
-        if not metrics.empty:
+        if metrics:
             metrics_file = "sec_metrics_NVDA.csv"
-            metrics.to_csv(metrics_file, index=False)
+            FinancialMetric.to_dataframe(metrics).to_csv(metrics_file, index=False)
             
             print(f"✓ Saved to {metrics_file}")
             print(f"  {len(metrics)} metrics saved")
@@ -621,34 +1408,45 @@ def example_save_to_file(ticker: str):
 class SECAnalysisPipeline:
     """완전한 SEC 분석 파이프라인"""
     
-    def __init__(self, company_name: str, email: str):
-        self.client = SECEdgarClient(company_name, email)
+    def __init__(self, client: SECEdgarClient):
+        self.client = client
         self.analyzer = SECFilingAnalyzer(self.client)
     
-    def analyze_company(self, ticker: str) -> Dict:
-        """회사 종합 분석"""
+    async def analyze_company(self, ticker: str, include_statements: bool = False) -> Dict:
+        """
+        회사 종합 분석
+        
+        Args:
+            ticker: 티커
+            include_statements: 최근 10-K 재무제표(Financial Report) 포함 여부
+        
+        Returns:
+            분석 결과 딕셔너리
+        """
         print(f"\n분석 중: {ticker}")
         print("-" * 50)
         
         # CIK 조회
-        cik = self.client.get_company_cik(ticker)
+        cik = await self.client.get_company_cik(ticker)
         
         if not cik:
             return {"error": "Ticker not found"}
         
-        # 기본 정보
-        submissions = self.client.get_submissions(cik)
-        
-        # 최근 Filing
-        recent_filings = self.analyzer.get_recent_filings(cik, limit=10)
+        # 기본 정보, 최근 Filing, 재무 지표, 매출 추이를 동시에 조회
+        tasks = [
+            self.client.get_submissions(cik),
+            self.analyzer.get_recent_filings(cik, limit=10),
+            self.analyzer.extract_financial_metrics(cik),
+            self.analyzer.analyze_revenue_trend(cik)
+        ]
         
-        # 재무 지표
-        metrics = self.analyzer.extract_financial_metrics(cik)
+        # 재무제표는 10-K HTML 대신 구조화된 Financial Report에서 조회
+        if include_statements:
+            tasks.append(self.analyzer.get_financial_statements(cik, form_type="10-K"))
         
-        # 매출 추이
-        revenue = self.analyzer.analyze_revenue_trend(cik)
+        submissions, recent_filings, metrics, revenue, *statements = await asyncio.gather(*tasks)
         
-        return {
+        result = {
             "ticker": ticker,
             "cik": cik,
             "company_info": submissions,
@@ -656,23 +1454,29 @@ class SECAnalysisPipeline:
             "financial_metrics": metrics,
             "revenue_trend": revenue
         }
+        
+        if include_statements:
+            result["financial_statements"] = statements[0]
+        
+        return result
 
 
-def example_full_pipeline(ticker: str):
+async def example_full_pipeline(client: SECEdgarClient, ticker: str):
     """
     완전한 파이프라인 예제
     
     Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
         ticker: 티커
     """
     print("\n" + "=" * 70)
     print("예제 8: 완전한 분석 파이프라인")
     print("=" * 70)
     
-    pipeline = SECAnalysisPipeline("Sayouzone", "sjkim@sayouzone.com")
+    pipeline = SECAnalysisPipeline(client)
     
-    # 회사 분석
-    result = pipeline.analyze_company(ticker)
+    # 회사 분석 (재무제표는 Financial Report에서 조회)
+    result = await pipeline.analyze_company(ticker, include_statements=True)
     
     if "error" not in result:
         info = result["company_info"]
@@ -684,7 +1488,42 @@ def example_full_pipeline(ticker: str):
         print(result['recent_filings'][['filingDate', 'form']].head())
         
         print(f"\n재무 지표: {len(result['financial_metrics'])} 개")
-        print(result['financial_metrics'].head())
+        print(tabulate(
+            [astuple(m) for m in result['financial_metrics'][:5]],
+            headers=FinancialMetric.headers()
+        ))
+        
+        print(f"\n재무제표 시트: {len(result['financial_statements'])} 개")
+    
+    print()
+
+
+async def example_batch_extract(client: SECEdgarClient, ticker: str):
+    """
+    여러 Filing 다운로드 + 텍스트 추출 파이프라인 예제
+    
+    Args:
+        client: SEC EDGAR API 클라이언트 (연결 재사용을 위해 공유)
+        ticker: 티커
+    """
+    print("\n" + "=" * 70)
+    print("예제 9: 여러 Filing 다운로드 + 텍스트 추출")
+    print("=" * 70)
+    
+    analyzer = SECFilingAnalyzer(client)
+    
+    cik = await client.get_company_cik(ticker)
+    
+    if cik:
+        # 최근 10-Q 문서
+        filings = await analyzer.get_recent_filings(cik, form_type="10-Q", limit=4)
+        
+        texts = await analyzer.extract_filing_texts(cik, filings)
+        
+        print(f"\n추출된 Filing: {len(texts)} 개")
+        for filing in filings.itertuples(index=False):
+            if filing.accessionNumber in texts:
+                print(f"{filing.filingDate:%Y-%m-%d} {filing.form}: {len(texts[filing.accessionNumber])} 문자")
     
     print()
 
@@ -693,7 +1532,7 @@ def example_full_pipeline(ticker: str):
 # 메인 실행
 # =============================================================================
 
-def main():
+async def main():
     """모든 예제 실행"""
     
     print("\n")
@@ -708,14 +1547,17 @@ def main():
     print()
     
     try:
-        example_basic_usage("AAPL")
-        example_recent_filings("TSLA")
-        example_financial_metrics("MSFT")
-        example_revenue_trend("GOOGL")
-        example_download_filing("AAPL")
-        example_compare_companies(["AAPL", "MSFT", "GOOGL"])
-        example_save_to_file("NVDA")
-        example_full_pipeline("AAPL")
+        # 하나의 클라이언트(연결 풀)를 모든 예제에서 재사용
+        async with SECEdgarClient("Sayouzone", "sjkim@sayouzone.com") as client:
+            await example_basic_usage(client, "AAPL")
+            await example_recent_filings(client, "TSLA")
+            await example_financial_metrics(client, "MSFT")
+            await example_revenue_trend(client, "GOOGL")
+            await example_download_filing(client, "AAPL")
+            await example_compare_companies(client, ["AAPL", "MSFT", "GOOGL"])
+            await example_save_to_file(client, "NVDA")
+            await example_full_pipeline(client, "AAPL")
+            await example_batch_extract(client, "AAPL")
         
         print("=" * 70)
         print("✅ 모든 예제 실행 완료!")
@@ -728,7 +1570,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
 
 """
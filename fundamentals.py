@@ -1,19 +1,188 @@
-import json
+import asyncio
+import inspect
 import logging
+import orjson
+import re
+import time
 import pandas as pd
 
+from collections import OrderedDict
 from fastmcp import FastMCP
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import Literal
 
+from utils.companydict import companydict
 from utils.crawler.fnguide import FnGuideCrawler
 from utils.yahoofinance import Fundamentals as YahooFundamentals
+from utils.yahoofinance import dataframe_to_records, series_to_dict
 from utils.gcpmanager import GCSManager
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(format="[%(levelname)s]: %(message)s", level=logging.INFO)
+
+def _serialize_tool_result(data) -> str:
+    """도구 결과를 orjson으로 직렬화 (NumPy 값/datetime 직접 처리, 표준 json보다 빠름)"""
+    return orjson.dumps(
+        data,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    ).decode("utf-8")
+
 
 #mcp = FastMCP(name="StockFundamentalsServer")
-mcp = FastMCP("Stocks MCP Server")
+mcp = FastMCP("Stocks MCP Server", tool_serializer=_serialize_tool_result)
+
+
+@lru_cache(maxsize=1)
+def _get_yahoo() -> YahooFundamentals:
+    """도구 호출마다 GCS 클라이언트를 새로 만들지 않도록 YahooFundamentals 인스턴스 재사용"""
+    return YahooFundamentals()
+
+
+@lru_cache(maxsize=1)
+def _get_gcs() -> GCSManager:
+    """GCS 저장 도구용 GCSManager 인스턴스 재사용"""
+    return GCSManager()
+
+
+@lru_cache(maxsize=64)
+def _get_fnguide(stock: str) -> FnGuideCrawler:
+    """종목별 FnGuideCrawler 인스턴스 재사용 (GCS 클라이언트 지연 초기화 결과 공유)"""
+    return FnGuideCrawler(stock=stock)
+
+
+# 종목 질의 분류용 정규식 (6자리 한국 종목 코드 / 1~5자 알파벳 티커)
+_KR_CODE_RE = re.compile(r"^\d{6}(\.K[SQ])?$", re.IGNORECASE)
+_US_TICKER_RE = re.compile(r"^[A-Z]{1,5}$")
+
+
+def _classify(query: str) -> Literal["kr_code", "kr_name", "us_ticker", "us_name", "unknown"]:
+    """
+    종목 질의를 크롤링 전에 분류합니다 (잘못 라우팅된 질의를 즉시 거절하기 위함).
+
+    Args:
+        query: 종목 코드 또는 회사명
+
+    Returns:
+        str: 분류 결과 (별칭 사전에 있으면 *_name, 형식만 맞으면 *_code/*_ticker)
+    """
+    query = query.strip()
+    ticker = companydict.get_ticker(query)
+    if ticker:
+        return "kr_name" if ticker.upper().endswith((".KS", ".KQ")) else "us_name"
+    if _KR_CODE_RE.match(query):
+        return "kr_code"
+    if _US_TICKER_RE.match(query.upper()):
+        return "us_ticker"
+    return "unknown"
+
+
+def _yahoo_query_error(query: str) -> str | None:
+    """
+    Yahoo Finance 도구로 조회할 수 없는 질의의 거절 사유를 반환합니다.
+
+    Args:
+        query: 종목 코드 또는 회사명
+
+    Returns:
+        str | None: 거절 사유 (조회 가능하면 None)
+    """
+    # 접미사 없는 6자리 코드는 Yahoo Finance 티커로 확정할 수 없으므로 즉시 거절
+    if _classify(query) == "kr_code" and not query.strip().upper().endswith((".KS", ".KQ")):
+        return f"'{query}' is a KR stock code. Append .KS/.KQ or use find_fnguide_data instead."
+    return None
+
+
+_MISS = object()
+
+
+def _ttl_cache(maxsize: int = 256, ttl: float = 300, casefold: tuple[str, ...] = ()):
+    """
+    도구 결과를 프로세스 메모리에 TTL LRU로 캐시하는 데코레이터
+
+    LLM 에이전트가 같은 질의를 짧은 간격으로 반복 호출할 때 GCS/크롤러를 다시 거치지 않는다.
+    casefold에 지정한 종목 인자만 대소문자 구분 없이 키를 만들고, use_cache=False 호출은 캐시를 건너뛴다.
+    async 함수는 같은 키의 동시 호출을 하나의 upstream 요청으로 합친다(single-flight).
+
+    Args:
+        maxsize: 최대 캐시 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+        ttl: 캐시 유효 시간 (초)
+        casefold: 대소문자 구분 없이 키를 만들 인자 이름 (예: ("query",))
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        entries: OrderedDict = OrderedDict()
+        locks: dict[tuple, asyncio.Lock] = {}
+
+        def make_key(args, kwargs) -> tuple | None:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if not bound.arguments.get("use_cache", True):
+                return None
+            return tuple(
+                value.casefold() if name in casefold and isinstance(value, str) else value
+                for name, value in bound.arguments.items()
+            )
+
+        def lookup(key: tuple):
+            entry = entries.get(key)
+            if entry is None:
+                return _MISS
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del entries[key]
+                return _MISS
+            entries.move_to_end(key)
+            return value
+
+        def store(key: tuple, value) -> None:
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                if key is None:
+                    return await func(*args, **kwargs)
+
+                value = lookup(key)
+                if value is not _MISS:
+                    return value
+
+                lock = locks.setdefault(key, asyncio.Lock())
+                try:
+                    async with lock:
+                        # 대기하는 동안 다른 호출이 채웠으면 그 결과 사용
+                        value = lookup(key)
+                        if value is _MISS:
+                            value = await func(*args, **kwargs)
+                            store(key, value)
+                finally:
+                    if not lock.locked():
+                        locks.pop(key, None)
+                return value
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+
+            value = lookup(key)
+            if value is _MISS:
+                value = func(*args, **kwargs)
+                store(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
 
 @mcp.tool(
     name="find_fnguide_data",
@@ -36,6 +205,7 @@ mcp = FastMCP("Stocks MCP Server")
     """,
     tags={"fnguide", "fundamentals", "korea", "standardized", "cached"}
 )
+@_ttl_cache(maxsize=256, ttl=300, casefold=("stock",))
 async def find_fnguide_data(stock: str, use_cache: bool = True):
     """
     FnGuide에서 한국 주식 재무제표 3종을 수집합니다.
@@ -54,9 +224,23 @@ async def find_fnguide_data(stock: str, use_cache: bool = True):
         - use_cache=True (기본값): GCS에서 캐시된 데이터를 먼저 확인 (빠름)
         - use_cache=False: 항상 새로 크롤링 (느림, 30초+ 소요)
     """
-    logger.info(f">>> 🛠️ Tool: 'find_fnguide_data' called for '{stock}'")
-
-    crawler = FnGuideCrawler(stock=stock)
+    logger.info(">>> 🛠️ Tool: '%s' called for %r", "find_fnguide_data", stock)
+
+    # 해외 종목이나 종목 코드로 변환할 수 없는 질의는 크롤링(최대 60초+) 없이 즉시 거절
+    kind = _classify(stock)
+    if kind in ("us_ticker", "us_name"):
+        return {"error": f"'{stock}' is not a KR ticker. Use get_yahoofinance_fundamentals instead."}
+    if kind == "unknown":
+        error = f"'{stock}' could not be resolved to a 6-digit KR stock code."
+        suggestion = companydict.suggest_company(stock)
+        if suggestion:
+            error += f" Did you mean '{suggestion}'?"
+        return {"error": error}
+
+    # FnGuide는 6자리 종목 코드만 인식하므로 회사명/접미사를 코드로 정규화
+    stock = companydict.get_code(stock.strip()) or stock.strip()[:6]
+
+    crawler = _get_fnguide(stock)
     data = await crawler.fundamentals(use_cache=use_cache)
     return data
 
@@ -70,7 +254,8 @@ async def find_fnguide_data(stock: str, use_cache: bool = True):
     ),
     tags={"finance", "stocks", "fundamentals", "global"}
 )
-def find_yahoofinance_data(query: str, attribute: str):
+@_ttl_cache(maxsize=256, ttl=300, casefold=("query",))
+async def find_yahoofinance_data(query: str, attribute: str):
     """
     단일 attribute를 가져오는 함수 (후방 호환성 유지)
 
@@ -81,14 +266,15 @@ def find_yahoofinance_data(query: str, attribute: str):
     Returns:
         
     """
-    logger.info(f">>> 🛠️ Tool: 'find_yahoofinance_data' called for '{query}'")
+    logger.info(">>> 🛠️ Tool: '%s' called for %r", "find_yahoofinance_data", query)
 
-    data = YahooFundamentals().fundamentals(query=query, attribute_name_str=attribute)
+    # yfinance는 blocking 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    data = await asyncio.to_thread(_get_yahoo().fundamentals, query=query, attribute_name_str=attribute)
 
     if isinstance(data, pd.DataFrame):
-        return json.loads(data.to_json(orient="records", date_format="iso"))
+        return dataframe_to_records(data)
     if isinstance(data, pd.Series):
-        return data.to_dict()
+        return series_to_dict(data)
     if isinstance(data, dict):
         return data
     
@@ -106,7 +292,8 @@ def find_yahoofinance_data(query: str, attribute: str):
     """,
     tags={"yahoo", "fundamentals", "global", "cached"}
 )
-def get_yahoofinance_fundamentals(query: str, use_cache: bool = True):
+@_ttl_cache(maxsize=256, ttl=300, casefold=("query",))
+async def get_yahoofinance_fundamentals(query: str, use_cache: bool = True):
     """
     재무제표 3종(income_stmt, balance_sheet, cashflow)을 한 번에 가져오는 통합 함수
 
@@ -128,10 +315,55 @@ def get_yahoofinance_fundamentals(query: str, use_cache: bool = True):
             "cash_flow": str | None  # 현금흐름표 (JSON 문자열)
         }
     """
-    logger.info(f">>> 🛠️ Tool: 'get_yahoofinance_fundamentals' called for '{query}'")
+    logger.info(">>> 🛠️ Tool: '%s' called for %r", "get_yahoofinance_fundamentals", query)
+
+    error = _yahoo_query_error(query)
+    if error:
+        return {"error": error}
+
+    # 리팩토링된 Fundamentals 클래스 사용 (캐싱 포함, 인스턴스 재사용)
+    data = await asyncio.to_thread(_get_yahoo().fundamentals, query=query, use_cache=use_cache)
+    return data
+
+
+@mcp.tool(
+    name="get_yahoofinance_fundamentals_batch",
+    description="""Yahoo Finance에서 여러 해외 주식의 재무제표를 한 번에 수집 (GCS 캐싱 지원).
+    사용 대상:
+    - 여러 종목을 동시에 비교/분석할 때: ["AAPL", "Tesla", "MSFT"]
+
+    반환: {티커: {ticker, country, balance_sheet, income_statement, cash_flow}}
+    """,
+    tags={"yahoo", "fundamentals", "global", "cached", "batch"}
+)
+async def get_yahoofinance_fundamentals_batch(queries: list[str], use_cache: bool = True):
+    """
+    여러 종목의 재무제표 3종을 한 번의 도구 호출로 가져오는 함수
+
+    get_yahoofinance_fundamentals와 같은 기준으로 질의를 검증해 거절된 질의는 오류 항목으로 돌려주고,
+    나머지는 티커로 변환해 중복을 제거한 뒤 하나의 스레드 풀에서 동시에 조회합니다.
 
-    # 리팩토링된 Fundamentals 클래스 사용 (캐싱 포함)
-    data = YahooFundamentals().fundamentals(query=query, use_cache=use_cache)
+    Args:
+        queries: 종목 코드 또는 회사명 리스트 (예: ['AAPL', 'Tesla', '마이크로소프트'])
+        use_cache: GCS 캐시 사용 여부 (기본값: True)
+
+    Returns:
+        dict: {티커: get_yahoofinance_fundamentals와 동일한 스키마} (거절된 질의는 {질의: {"ticker", "error"}})
+    """
+    logger.info(">>> 🛠️ Tool: '%s' called for %s", "get_yahoofinance_fundamentals_batch", queries)
+
+    rejected = {}
+    tickers = {}
+    for query in queries:
+        error = _yahoo_query_error(query)
+        if error:
+            rejected[query] = {"ticker": query, "error": error}
+        else:
+            # 별칭 → 티커 변환 후 순서를 유지하며 중복 제거
+            tickers.setdefault(companydict.get_ticker(query) or query.upper(), None)
+
+    data = await asyncio.to_thread(_get_yahoo().fundamentals_batch, list(tickers), use_cache=use_cache)
+    data.update(rejected)
     return data
 
 @mcp.tool(
@@ -139,7 +371,7 @@ def get_yahoofinance_fundamentals(query: str, use_cache: bool = True):
     description="Saves fundamentals data to a CSV file in Google Cloud Storage.",
     tags={"gcs", "fundamentals", "storage"}
 )
-def save_fundamentals_data_to_gcs(
+async def save_fundamentals_data_to_gcs(
     data: dict | list, 
     gcs_path: str, 
     file_name: str) -> str:
@@ -154,7 +386,7 @@ def save_fundamentals_data_to_gcs(
     Returns:
         A message about saving fundamental data to GCS
     """
-    logger.info(f">>> 🛠️ Tool: 'save_fundamentals_data_to_gcs' called for '{gcs_path}'")
+    logger.info(">>> 🛠️ Tool: '%s' called for %r", "save_fundamentals_data_to_gcs", gcs_path)
 
     if not data:
         return "Fundamentals data cannot be empty."
@@ -166,13 +398,13 @@ def save_fundamentals_data_to_gcs(
     else:
         return "Data must be a dict or a list of dicts."
 
-    csv_data = df.to_csv(index=False)
-
-    gcs_manager = GCSManager()
+    gcs_manager = await asyncio.to_thread(_get_gcs)
     destination_blob_name = f"{gcs_path}/{file_name}"
     
-    success = gcs_manager.upload_file(
-        source_file=csv_data,
+    # CSV 전체 문자열을 만들지 않고 업로드 스트림에 바로 기록 (blocking I/O는 스레드에서 실행)
+    success = await asyncio.to_thread(
+        gcs_manager.upload_stream,
+        df,
         destination_blob_name=destination_blob_name,
         content_type="text/csv"
     )
@@ -1,25 +1,30 @@
-import asyncio
 import logging
 import os
-from typing import List, Dict, Any
 
-from fastmcp import FastMCP
+import uvicorn
 
 from fundamentals import mcp
 
 logger = logging.getLogger(__name__)
+# 로깅 설정은 서버 진입점에서 한 번만 (다른 모듈은 모듈 logger만 사용)
 logging.basicConfig(format="[%(levelname)s]: %(message)s", level=logging.INFO)
 
+# 워커 프로세스 수 (기본 1, 코어 수만큼 늘리려면 WEB_CONCURRENCY 설정)
+WORKERS = int(os.getenv("WEB_CONCURRENCY", 1))
+
+# 워커가 여럿이면 요청이 어느 프로세스로 갈지 모르므로 세션 상태 없이(stateless) 동작
+app = mcp.http_app(stateless_http=WORKERS > 1)
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8080))
-    logger.info(f"🚀 Stocks MCP server started on port {port}")
+    logger.info("🚀 Stocks MCP server started on port %d (%d workers)", port, WORKERS)
     #mcp.run()
-    """"""
-    asyncio.run(
-        mcp.run_async(
-            transport="http",
-            host="0.0.0.0",
-            port=port,
-        )
+    # uvloop/httptools가 설치되어 있으면 자동으로 사용
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=port,
+        workers=WORKERS,
+        loop="auto",
+        http="auto",
     )
-    """"""
\ No newline at end of file
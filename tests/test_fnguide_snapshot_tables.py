@@ -0,0 +1,62 @@
+"""
+FnGuide Snapshot 테이블 파싱 회귀 테스트
+
+_read_html_tables()가 pandas.read_html()과 같은 결과를 내는지
+저장해 둔 Snapshot 페이지(tests/data/fnguide_snapshot.html)로 확인한다.
+"""
+
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from utils.crawler.fnguide import FnGuideMain, _read_html_tables
+
+SNAPSHOT_HTML = Path(__file__).parent / "data" / "fnguide_snapshot.html"
+
+
+@pytest.fixture(scope="module")
+def snapshot_bytes() -> bytes:
+    return SNAPSHOT_HTML.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def snapshot_frames(snapshot_bytes):
+    return _read_html_tables(snapshot_bytes, "utf-8")
+
+
+def test_matches_pandas_read_html(snapshot_bytes, snapshot_frames):
+    """테이블 개수/순서, 컬럼명, 값, dtype이 read_html과 동일해야 한다."""
+    expected = pd.read_html(StringIO(snapshot_bytes.decode("utf-8")))
+
+    assert len(snapshot_frames) == len(expected)
+    for frame, reference in zip(snapshot_frames, expected):
+        pd.testing.assert_frame_equal(frame, reference)
+
+
+def test_duplicate_headers_are_renamed(snapshot_frames):
+    """중복/colspan 헤더는 X, X.1 형태로 구분되어야 한다."""
+    assert snapshot_frames[0].columns.tolist() == ["헤더", "내용", "헤더.1", "내용.1"]
+    assert snapshot_frames[3].columns.tolist() == ["구분", "구분.1", "2024"]
+
+
+def test_hidden_tables_are_skipped(snapshot_frames):
+    """display:none 테이블이 main_table_selectors 인덱스를 밀어내면 안 된다."""
+    assert all("우선주" not in frame.columns for frame in snapshot_frames)
+    for name, index in FnGuideMain().main_table_selectors:
+        if name.startswith("financialhighlight"):
+            assert snapshot_frames[index].columns[0][0] == "IFRS(연결)"
+
+
+def test_parse_keeps_duplicate_columns(snapshot_frames):
+    """to_dict 변환 시 중복 헤더의 값이 유실되지 않아야 한다."""
+    datasets = FnGuideMain().parse(snapshot_frames, stock="005930")
+
+    market = datasets["market_conditions"][0]
+    assert market["header"] == "종가/ 전일대비"
+    assert market["header_1"] == "거래량"
+
+    governance = datasets["governance"]
+    assert governance[0]["category"] == "이사회"
+    assert governance[0]["구분.1"] == "사외이사 비율"
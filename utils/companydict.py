@@ -1,3 +1,6 @@
+import ahocorasick
+
+
 class companydict:
     temp_dict = {
         '삼성전자': {
@@ -54,28 +57,89 @@ class companydict:
 
     @staticmethod
     def get_code(user_input):
-        for company_info in companydict.temp_dict.values():
-            if user_input in company_info['company']:
-                return company_info['code']
-        return None
+        entry = _lookup(user_input)
+        return entry['code'] if entry else None
         
     @staticmethod
     def get_ticker(user_input):
-        for company_info in companydict.temp_dict.values():
-            if user_input in company_info['company']:
-                return company_info['ticker']
-        return None
+        entry = _lookup(user_input)
+        return entry['ticker'] if entry else None
     
     @staticmethod
     def get_company(user_input):
-        for company_info in companydict.temp_dict.values():
-            if user_input in company_info['company']:
-                return company_info['company'][0]
-        return None
+        entry = _lookup(user_input)
+        return entry['company'][0] if entry else None
 
     @staticmethod
     def get_company_by_code(code_input):
-        for company_name, company_info in companydict.temp_dict.items():
-            if code_input == company_info['code']:
-                return company_name
-        return None
\ No newline at end of file
+        return _CODE_TO_NAME.get(_normalize(code_input))
+
+    @staticmethod
+    def suggest_company(user_input):
+        # "혹시 이 회사인가요?" 안내용 부분 일치 (조회 결과로 바로 쓰지 않는다)
+        entry = _suggest(user_input)
+        return entry['company'][0] if entry else None
+
+
+def _normalize(value):
+    # 대소문자 구분 없이 조회 ('samsung', 'SAMSUNG', 'Samsung' 동일)
+    return value.casefold() if isinstance(value, str) else None
+
+
+def _is_word_char(text, index):
+    return 0 <= index < len(text) and text[index].isalnum()
+
+
+def _lookup(user_input):
+    """
+    별칭으로 회사 정보 조회 (정확히 일치하는 별칭만 인정)
+    """
+    key = _normalize(user_input)
+    if key is None:
+        return None
+    return _ALIAS_TO_ENTRY.get(key)
+
+
+def _suggest(user_input):
+    """
+    질의 안에 단어 단위로 포함된 가장 긴 별칭의 회사 정보 조회
+
+    Aho-Corasick 오토마톤으로 질의를 한 번만 훑는다
+    (예: 'Samsung Electronics Co., Ltd.' → 'samsung electronics', '애플 주가' → '애플').
+    별칭이 더 긴 단어의 일부인 경우('삼성전자' ⊂ '삼성전자우', 'SEC' ⊂ 'securities')는
+    다른 종목일 수 있으므로 제외한다.
+    """
+    key = _normalize(user_input)
+    if key is None:
+        return None
+
+    entry = _ALIAS_TO_ENTRY.get(key)
+    if entry is not None:
+        return entry
+
+    best_alias, best_entry = '', None
+    for end, (alias, info) in _ALIAS_AUTOMATON.iter(key):
+        start = end - len(alias) + 1
+        if _is_word_char(key, start - 1) or _is_word_char(key, end + 1):
+            continue
+        if len(alias) > len(best_alias):
+            best_alias, best_entry = alias, info
+    return best_entry
+
+# 별칭/코드 → 회사 정보 역색인 (모듈 로드 시 한 번만 구성, 조회는 O(1))
+_ALIAS_TO_ENTRY = {}
+_CODE_TO_NAME = {}
+# 부분 일치 제안용 별칭 오토마톤 (질의 길이에 비례하는 한 번의 탐색)
+_ALIAS_AUTOMATON = ahocorasick.Automaton()
+
+for _name, _info in companydict.temp_dict.items():
+    for _alias in _info['company']:
+        _key = _normalize(_alias)
+        if _key not in _ALIAS_TO_ENTRY:
+            _ALIAS_TO_ENTRY[_key] = _info
+            _ALIAS_AUTOMATON.add_word(_key, (_key, _info))
+    _CODE_TO_NAME.setdefault(_normalize(_info['code']), _name)
+
+_ALIAS_AUTOMATON.make_automaton()
+
+del _name, _info, _alias, _key
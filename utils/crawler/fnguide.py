@@ -4,7 +4,7 @@ FnGuide 크롤러 - 정적/동적 재무 데이터 수집 + GCS 저장
 FnGuide 웹사이트에서 기업 재무 정보를 크롤링하여 GCS에 저장합니다.
 
 주요 기능:
-- 정적 테이블: requests + pandas.read_html로 시장 상황, 지배구조 등 수집
+- 정적 테이블: httpx(비동기) + lxml로 시장 상황, 지배구조 등 수집
 - 동적 테이블: Playwright로 포괄손익계산서, 재무상태표, 현금흐름표 수집
 - GCS 연동: 파티션 기반 폴더 구조(year=YYYY/quarter=Q/)로 데이터 저장
 - 캐싱: use_cache 파라미터로 기존 데이터 재사용
@@ -16,16 +16,26 @@ FnGuide 웹사이트에서 기업 재무 정보를 크롤링하여 GCS에 저장
     >>> print(data.keys())
 """
 
-import requests
+import httpx
+import lxml.html
+import numpy as np
+import orjson
 import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
 from datetime import date
-from io import StringIO
-import json
+from io import BytesIO, TextIOWrapper
+import logging
 import os
+import re
 import asyncio
+import csv
+import gzip
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from bs4 import BeautifulSoup
 from typing import Any, Dict, List, Tuple, Optional
 
 # 직접 실행 시를 위한 경로 설정
@@ -34,10 +44,428 @@ if __name__ == "__main__":
     if str(_backend_dir) not in sys.path:
         sys.path.insert(0, str(_backend_dir))
 
+# 회사명 조회용 사전 (종목 코드 → 회사명, 컬럼 번역 시 사용)
+try:
+    from utils.companydict import companydict as _companydict
+except ImportError:
+    try:
+        from ..companydict import companydict as _companydict
+    except ImportError:
+        _companydict = None
+
+
+logger = logging.getLogger(__name__)
 
 # 파티션 폴더명 접두사 (GCS 저장 경로용)
 QUARTER_PREFIX = "quarter="
 
+# 원본 HTML 바이트에서 <table>...</table> 조각을 잘라내기 위한 패턴
+_TABLE_RE = re.compile(rb"<table[^>]*>.*?</table>", re.S | re.I)
+# 조각 안의 또 다른 <table 시작 태그 (중첩 테이블이면 조각이 첫 </table>에서 잘림)
+_TABLE_OPEN_RE = re.compile(rb"<table[\s>]", re.I)
+
+# 셀 텍스트의 줄바꿈/연속 공백 (pandas.read_html과 같은 패턴)
+_WHITESPACE_RE = re.compile(r"[\r\n]+|\s{2,}")
+
+# 레거시 blob 경로에서 "{종목}_{테이블명}" 파일명 부분을 잘라내기 위한 패턴
+# (테이블명이 한글이므로 [A-Za-z0-9_] 대신 '/' 이외의 문자를 허용)
+_LEGACY_BLOB_RE = re.compile(r"([^/]*_[^/]+)\.(?:csv|json)$")
+
+
+def _build_client() -> httpx.AsyncClient:
+    """
+    FnGuide 요청용 비동기 HTTP 클라이언트 생성
+
+    HTTP/2로 같은 호스트의 요청을 하나의 연결에 다중화하고,
+    커넥션 풀을 재사용(keep-alive)하며 연결 실패는 재시도한다.
+
+    Returns:
+        httpx.AsyncClient: 커넥션 풀/타임아웃이 설정된 클라이언트
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        headers={
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/141.0 Safari/537.36"
+            ),
+        },
+    )
+
+
+def _cell_text(cell) -> str:
+    """셀 텍스트 정리 (줄바꿈/연속 공백을 공백 하나로, pandas.read_html과 동일)"""
+    return _WHITESPACE_RE.sub(" ", cell.text_content()).strip()
+
+
+def _expand_rows(
+    trs: list,
+    remainder: list[tuple[int, str, int]] | None = None,
+    overflow: bool = False,
+) -> tuple[list[list[str]], list[tuple[int, str, int]]]:
+    """
+    tr 요소 목록을 colspan/rowspan이 펼쳐진 2차원 문자열 그리드로 변환
+
+    pandas.read_html의 규칙을 그대로 따른다. (이전 구역에서 이어지는 rowspan 포함)
+
+    Args:
+        trs: lxml tr 요소 리스트
+        remainder: 이전 구역(thead 등)에서 이어지는 (열 위치, 텍스트, 남은 행 수) 목록
+        overflow: True면 남은 rowspan을 다음 구역으로 넘기고, False면 행을 추가해 채움
+
+    Returns:
+        tuple: (행별 셀 텍스트, 다음 구역으로 넘길 rowspan 목록)
+    """
+    grid: list[list[str]] = []
+    remainder = remainder if remainder is not None else []
+
+    for tr in trs:
+        row: list[str] = []
+        next_remainder: list[tuple[int, str, int]] = []
+
+        index = 0
+        for cell in tr.xpath("./td|./th"):
+            # 이 셀 앞쪽에 위 행의 rowspan으로 이어지는 셀 채우기
+            while remainder and remainder[0][0] <= index:
+                prev_index, prev_text, prev_rowspan = remainder.pop(0)
+                row.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+                index += 1
+
+            text = _cell_text(cell)
+            rowspan = int(cell.get("rowspan") or 1)
+            colspan = int(cell.get("colspan") or 1)
+            for _ in range(colspan):
+                row.append(text)
+                if rowspan > 1:
+                    next_remainder.append((index, text, rowspan - 1))
+                index += 1
+
+        # 뒤쪽 열에 남은 rowspan 셀 채우기
+        for prev_index, prev_text, prev_rowspan in remainder:
+            row.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+
+        grid.append(row)
+        remainder = next_remainder
+
+    if not overflow:
+        # 이전 행의 rowspan 때문에만 생기는 행 추가
+        while remainder:
+            next_remainder = []
+            row = []
+            for prev_index, prev_text, prev_rowspan in remainder:
+                row.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_index, prev_text, prev_rowspan - 1))
+            grid.append(row)
+            remainder = next_remainder
+
+    return grid, remainder
+
+
+def _table_to_frame(table) -> pd.DataFrame | None:
+    """
+    lxml table 요소를 DataFrame으로 변환 (pandas.read_html과 같은 규칙)
+
+    thead(없으면 th로만 이루어진 앞쪽 행)를 헤더로 사용하고, 헤더가 여러 줄이면
+    MultiIndex 컬럼을 만든다. 중복 컬럼명은 "X.1", "X.2"로 바꾸고, 빈 셀과
+    기본 결측 문자열("N/A", "-nan" 등)은 NaN, 천 단위 콤마가 있는 숫자는 숫자형으로 변환한다.
+    (헤더/값 변환은 read_html과 같은 pandas TextParser에 맡김)
+
+    Args:
+        table: lxml table 요소
+
+    Returns:
+        pd.DataFrame | None: 테이블 데이터 (데이터가 없는 테이블이면 None)
+    """
+    header_trs = []
+    for thead in table.xpath(".//thead"):
+        header_trs.extend(thead.xpath("./tr"))
+        # <tr> 없이 <thead> 바로 아래에 셀이 있는 경우 thead를 행으로 취급
+        if thead.xpath("./td|./th"):
+            header_trs.append(thead)
+    body_trs = table.xpath(".//tbody//tr") + table.xpath("./tr")
+    footer_trs = table.xpath(".//tfoot//tr")
+
+    if not header_trs:
+        while body_trs and all(cell.tag == "th" for cell in body_trs[0].xpath("./td|./th")):
+            header_trs.append(body_trs.pop(0))
+
+    head, remainder = _expand_rows(header_trs)
+    body, remainder = _expand_rows(body_trs, remainder, overflow=bool(footer_trs))
+    foot, _ = _expand_rows(footer_trs, remainder)
+
+    header = None
+    if head:
+        body = head + body
+        if len(head) == 1:
+            header = 0
+        else:
+            # 텍스트가 모두 빈 헤더 행은 제외
+            header = [i for i, row in enumerate(head) if any(row)]
+    body += foot
+
+    width = max((len(row) for row in body), default=0)
+    body = [row + [""] * (width - len(row)) for row in body]
+
+    try:
+        with TextParser(body, header=header, thousands=",") as parser:
+            return parser.read()
+    except EmptyDataError:
+        return None
+
+
+def _stripped_text(element) -> str:
+    """
+    요소의 텍스트 노드를 각각 strip하여 이어붙임 (BeautifulSoup get_text(strip=True)와 동일)
+
+    Args:
+        element: lxml 요소
+
+    Returns:
+        str: 정리된 텍스트
+    """
+    # 자식 요소가 없는 셀(<td>값</td>, 대부분의 경우)은 text만 읽어 트리 순회를 생략
+    if len(element) == 0:
+        return (element.text or "").strip()
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _outer_html(element) -> str:
+    """lxml 요소의 HTML 문자열 (디버그 출력용)"""
+    return lxml.html.tostring(element, encoding="unicode")
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _flatten_column_key(column: Any) -> str:
+    """
+    컬럼 키(튜플이면 " / "로 결합)를 단일 문자열로 변환
+
+    Args:
+        column: DataFrame 컬럼 키
+
+    Returns:
+        str: 평탄화된 키 (비어 있으면 "value")
+    """
+    if isinstance(column, tuple):
+        parts = [str(part).strip() for part in column if part not in (None, "")]
+        key = " / ".join(parts)
+    elif column is None:
+        key = ""
+    else:
+        key = str(column).strip()
+
+    return key or "value"
+
+
+def _records_to_json(records: list[dict]) -> str:
+    """
+    레코드 리스트를 JSON 문자열로 직렬화 (orjson 사용, 한글은 이스케이프하지 않음)
+
+    Args:
+        records: 테이블 레코드 리스트
+
+    Returns:
+        str: JSON 문자열 (NaN은 null로 변환)
+    """
+    return orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+@lru_cache(maxsize=8)
+def _html_parser(encoding: str | None = None, remove_blank_text: bool = True) -> lxml.html.HTMLParser:
+    """
+    스크래핑용으로 설정한 lxml HTML 파서 (charset별로 재사용)
+
+    ID 해시 테이블 생성(collect_ids), 주석/PI, 태그 사이 공백 텍스트 노드처럼
+    테이블 추출에 쓰지 않는 항목은 만들지 않는다.
+
+    Args:
+        encoding: 문서 charset (None이면 <meta charset>으로 판별)
+        remove_blank_text: 태그 사이 공백 텍스트 노드 제거 여부
+
+    Returns:
+        lxml.html.HTMLParser: 파서
+    """
+    return lxml.html.HTMLParser(
+        encoding=encoding,
+        collect_ids=False,
+        remove_comments=True,
+        remove_pis=True,
+        remove_blank_text=remove_blank_text,
+    )
+
+
+def _parse_document(content: bytes, encoding: str | None = None):
+    """
+    응답 바이트를 그대로 lxml로 파싱 (파이썬 str 디코딩 단계 생략)
+
+    Args:
+        content: 페이지 HTML 바이트
+        encoding: 응답 헤더의 charset (None이면 lxml이 <meta charset>으로 판별)
+
+    Returns:
+        lxml 루트 요소
+    """
+    return lxml.html.fromstring(content, parser=_html_parser(encoding))
+
+
+def _find_table_fragments(content: bytes, titles: list[str], encoding: str) -> dict[str, Any]:
+    """
+    각 제목을 포함하는 첫 번째 table 조각을 한 번의 순회로 찾아 파싱
+
+    페이지 전체(스크립트/스타일 포함)를 트리로 만들지 않고,
+    제목 바이트가 들어 있는 table 조각만 lxml에 넘긴다.
+
+    Args:
+        content: 페이지 HTML 바이트
+        titles: 찾을 테이블 제목 리스트 (예: ["포괄손익계산서", "재무상태표"])
+        encoding: 페이지 charset (제목을 같은 인코딩의 바이트로 비교)
+
+    Returns:
+        dict[str, Any]: 제목 -> lxml table 요소 (찾지 못한 제목은 제외)
+    """
+    needles = {title: title.encode(encoding) for title in titles}
+    found: dict[str, Any] = {}
+    for match in _TABLE_RE.finditer(content):
+        fragment = match.group()
+        candidates = [t for t, needle in needles.items() if t not in found and needle in fragment]
+        if not candidates:
+            continue
+        # 중첩 테이블이 있으면 잘린 조각이므로 건너뛰고 전체 페이지 파싱에 맡긴다
+        if _TABLE_OPEN_RE.search(fragment, 1):
+            continue
+        # 속성값 등 마크업에만 제목이 있는 경우는 제외 (텍스트 기준으로 확인)
+        table = _parse_document(fragment, encoding)
+        text = table.text_content()
+        for title in candidates:
+            if title in text:
+                found[title] = table
+        if len(found) == len(needles):
+            break
+    return found
+
+
+def _read_html_tables(content: bytes, encoding: str | None = None) -> list[pd.DataFrame]:
+    """
+    HTML을 lxml로 한 번만 파싱하여 모든 table을 DataFrame 리스트로 변환
+
+    pandas.read_html 대신 사용 (테이블이 많은 페이지에서 훨씬 빠름)
+
+    Args:
+        content: 페이지 HTML 바이트
+        encoding: 응답 헤더의 charset
+
+    Returns:
+        list[pd.DataFrame]: 문서 순서대로의 테이블 리스트
+    """
+    # read_html과 같은 텍스트가 나오도록 태그 사이 공백 텍스트도 유지하는 파서 사용
+    root = lxml.html.fromstring(content, parser=_html_parser(encoding, remove_blank_text=False))
+
+    frames = []
+    for table in root.xpath("//table"):
+        # 텍스트(줄바꿈 제외)가 없는 테이블과 숨김(display:none) 테이블은 read_html처럼 제외
+        if not table.xpath(".//text()[string-length(translate(., '\n', '')) > 0]"):
+            continue
+        if _is_hidden(table):
+            continue
+        # 테이블 안의 <style>과 숨김 요소도 제외
+        for element in table.xpath(".//style"):
+            element.drop_tree()
+        for element in table.xpath(".//*[@style]"):
+            if _is_hidden(element):
+                element.drop_tree()
+
+        frame = _table_to_frame(table)
+        if frame is not None:
+            frames.append(frame)
+    return frames
+
+
+def _is_hidden(element) -> bool:
+    """style 속성에 display:none이 있는지 확인"""
+    return "display:none" in element.get("style", "").replace(" ", "")
+
+
+# HTML 파싱 전용 프로세스 수 (기본: CPU 코어 수)
+PARSE_WORKERS = int(os.getenv("FNGUIDE_PARSE_WORKERS", os.cpu_count() or 1))
+
+# GCS 동시 업로드 수 (테이블별 CSV 파일)
+GCS_UPLOAD_WORKERS = 8
+
+# 업로드 CSV gzip 압축 레벨 (1: 속도 우선, 반복적인 재무 테이블은 레벨 1로도 충분히 줄어듦)
+GCS_GZIP_LEVEL = 1
+
+# 파싱용 프로세스 풀 (최초 파싱 시 생성)
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """
+    HTML 파싱용 프로세스 풀 지연 초기화
+
+    파싱/DataFrame 생성은 GIL을 잡는 CPU 작업이므로 별도 프로세스에서 실행하여
+    여러 종목을 동시에 처리할 때 코어 수만큼 확장되게 한다.
+    (이벤트 루프/HTTP 클라이언트 스레드가 있는 프로세스이므로 fork 대신 forkserver 사용)
+
+    Returns:
+        ProcessPoolExecutor: 공유 프로세스 풀
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _parse_pool
+
+
+_BASE_URL = "https://comp.fnguide.com/SVO2/ASP/"
+
+# 페이지 종류 -> FnGuide ASP 페이지
+_ENDPOINTS = {
+    "main": "SVD_main.asp",
+    "company": "SVD_Corp.asp",
+    # 재무제표 (메뉴 파라미터 포함 버전: ...&cID=&MenuYn=Y&ReportGB=&NewMenuID=103&stkGb=701)
+    "finance": "SVD_Finance.asp",
+    "finance_ratio": "SVD_FinanceRatio.asp",
+    "invest": "SVD_Invest.asp",
+    "consensus": "SVD_Consensus.asp",
+    "share_analysis": "SVD_shareanalysis.asp",
+    "industry_analysis": "SVD_ujanal.asp",
+    "comparison": "SVD_Comparison.asp",
+    "disclosure": "SVD_Disclosure.asp",
+    "dart": "SVD_Dart.asp",
+}
+
+
+@lru_cache(maxsize=512)
+def _build_url(endpoint: str, stock: str) -> str:
+    """
+    종목별 FnGuide 페이지 URL 생성 (같은 종목/페이지는 캐시 재사용)
+
+    Args:
+        endpoint: _ENDPOINTS의 페이지 종류 (예: "main", "finance")
+        stock: 종목 코드 (6자리)
+
+    Returns:
+        str: 페이지 URL
+    """
+    return f"{_BASE_URL}{_ENDPOINTS[endpoint]}?pGB=1&gicode=A{stock}"
+
+
+def _url_property(endpoint: str) -> property:
+    """현재 self.stock 기준의 페이지 URL을 돌려주는 읽기 전용 프로퍼티 생성"""
+    return property(lambda self: _build_url(endpoint, self.stock))
+
 
 class FnGuideCrawler:
     """FnGuide 데이터 크롤러 - 메인(Snapshot) / 재무제표 테이블 수집 + GCS 저장"""
@@ -45,6 +473,22 @@ class FnGuideCrawler:
     # Playwright로 가져올 동적 테이블
     finance_table_titles = ["포괄손익계산서", "재무상태표", "현금흐름표"]
 
+    # 모든 인스턴스가 공유하는 HTTP 클라이언트 (최초 요청 시 생성, TCP/TLS 연결 재사용)
+    _client: httpx.AsyncClient | None = None
+
+    # 페이지 URL (self.stock 기준으로 접근 시 생성)
+    main_url = _url_property("main")                            # Snapshot(메인)
+    company_url = _url_property("company")                      # 기업개요
+    finance_url = _url_property("finance")                      # 재무제표
+    finance_ratio_url = _url_property("finance_ratio")          # 재무비율
+    invest_url = _url_property("invest")                        # 투자지표
+    consensus_url = _url_property("consensus")                  # 컨센서스
+    share_analysis_url = _url_property("share_analysis")        # 지분분석
+    industry_analysis_url = _url_property("industry_analysis")  # 업종분석
+    comparison_url = _url_property("comparison")                # 경쟁사비교
+    disclosure_url = _url_property("disclosure")                # 거래소공시
+    dart_url = _url_property("dart")                            # 금감원공시
+
     def __init__(self, stock: str = "005930", bucket_name: str = "sayouzone-ai-stocks"):
         """
         FnGuide 크롤러 초기화
@@ -55,30 +499,6 @@ class FnGuideCrawler:
         """
         self.stock = stock
 
-        #Snapshot(메인)
-        self.main_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_main.asp?pGB=1&gicode=A{stock}"
-        #기업개요
-        self.company_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Corp.asp?pGB=1&gicode=A{stock}"
-        #재무제표
-        #self.finance_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Finance.asp?pGB=1&gicode=A{stock}&cID=&MenuYn=Y&ReportGB=&NewMenuID=103&stkGb=701"
-        self.finance_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Finance.asp?pGB=1&gicode=A{stock}"
-        #재무비율
-        self.finance_ratio_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_FinanceRatio.asp?pGB=1&gicode=A{stock}"
-        #투자지표
-        self.invest_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Invest.asp?pGB=1&gicode=A{stock}"
-        #컨센서스
-        self.consensus_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Consensus.asp?pGB=1&gicode=A{stock}"
-        #지분분석
-        self.share_analysis_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_shareanalysis.asp?pGB=1&gicode=A{stock}"
-        #업종분석
-        self.industry_analysis_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_ujanal.asp?pGB=1&gicode=A{stock}"
-        #경쟁사비교
-        self.comparison_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Comparison.asp?pGB=1&gicode=A{stock}"
-        #거래소공시
-        self.disclosure_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Disclosure.asp?pGB=1&gicode=A{stock}"
-        #금감원공시
-        self.dart_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Dart.asp?pGB=1&gicode=A{stock}"
-
         self.fnguide_main = FnGuideMain()
 
         # GCS Manager 초기화 (지연 초기화 패턴)
@@ -86,22 +506,60 @@ class FnGuideCrawler:
         self._gcs = None
         self._gcs_initialized = False
 
+        # (폴더, 종목, 테이블명) -> 후보 blob 이름 캐시
+        self._candidate_cache: dict[tuple[str, str, str], tuple[str, ...]] = {}
+        # 캐시 확인 대상 테이블명 (Snapshot 정적 테이블 + 재무제표)
+        self._all_table_names: tuple[str, ...] = (
+            *(name for name, _ in FnGuideMain.main_table_selectors),
+            *self.finance_table_titles,
+        )
+        # 테이블명 -> 레거시 폴더의 (실제 blob 경로, 후보 이름들) (_collect_existing_files에서 생성)
+        self._legacy_index: dict[str, list[tuple[str, list[str]]]] = {}
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 지연 초기화"""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = _build_client()
+        return cls._client
+
+    async def _fetch_html(self, url: str) -> tuple[bytes, str | None]:
+        """
+        페이지 HTML 요청
+
+        본문은 str로 디코딩하지 않고 바이트 그대로 반환하여 파서가 직접 디코딩하게 한다.
+
+        Args:
+            url: 요청 URL
+
+        Returns:
+            tuple[bytes, str | None]: (HTML 바이트, charset - None이면 <meta charset>으로 판별)
+        """
+        response = await self._get_client().get(url)
+        response.raise_for_status()
+
+        content = response.content
+        encoding = response.charset_encoding
+        # 헤더에도 <meta charset>에도 인코딩이 없으면 lxml이 latin-1로 읽으므로 UTF-8로 지정
+        if encoding is None and b"charset" not in content[:4096].lower():
+            encoding = "utf-8"
+        return content, encoding
+
     @staticmethod
     def _flatten_column_key(column: Any) -> str:
         """
         멀티인덱스 컬럼 키를 JSON 직렬화가 가능한 단일 문자열로 변환한다.
-        """
-        if isinstance(column, tuple):
-            parts = [str(part).strip() for part in column if part not in (None, "")]
-            key = " / ".join(parts)
-        elif column is None:
-            key = ""
-        else:
-            key = str(column).strip()
-
-        return key or "value"
 
-    def _dataframe_to_records(self, frame: pd.DataFrame) -> list[dict[str, Any]]:
+        같은 컬럼 키가 여러 테이블/요청에 반복되므로 결과를 캐시한다.
+        """
+        try:
+            return _flatten_column_key(column)
+        except TypeError:
+            # 해시할 수 없는 키는 캐시 없이 변환
+            return _flatten_column_key.__wrapped__(column)
+
+    @classmethod
+    def _dataframe_to_records(cls, frame: pd.DataFrame) -> list[dict[str, Any]]:
         """
         DataFrame을 JSON 직렬화를 위한 레코드 리스트로 변환한다.
 
@@ -111,24 +569,29 @@ class FnGuideCrawler:
         if frame.empty:
             return []
 
-        flattened_columns = [self._flatten_column_key(col) for col in frame.columns]
-        records: list[dict[str, Any]] = []
-
-        for index_label, row in frame.iterrows():
-            record: dict[str, Any] = {"period": str(index_label)}
-            for key, value in zip(flattened_columns, row.tolist()):
-                if key in record:
-                    suffix = 2
+        # 중복 키 해소는 모든 행에서 동일하므로 컬럼 기준으로 한 번만 계산
+        keys: list[str] = []
+        used = {"period"}
+        for key in (cls._flatten_column_key(col) for col in frame.columns):
+            if key in used:
+                suffix = 2
+                new_key = f"{key}_{suffix}"
+                while new_key in used:
+                    suffix += 1
                     new_key = f"{key}_{suffix}"
-                    while new_key in record:
-                        suffix += 1
-                        new_key = f"{key}_{suffix}"
-                    record[new_key] = value
-                else:
-                    record[key] = value
-            records.append(record)
+                key = new_key
+            used.add(key)
+            keys.append(key)
+
+        # 결측값(NaN/NA)은 JSON/CSV에서 일관되게 비어 있도록 None으로 변환
+        if frame.isna().to_numpy().any():
+            frame = frame.astype(object).where(frame.notna(), None)
 
-        return records
+        # iterrows()의 행별 Series 생성 대신 한 번에 파이썬 리스트로 변환
+        return [
+            {"period": str(index_label), **dict(zip(keys, values))}
+            for index_label, values in zip(frame.index.tolist(), frame.to_numpy().tolist())
+        ]
 
     @property
     def gcs(self):
@@ -177,9 +640,7 @@ class FnGuideCrawler:
             }
         """
         if stock:
-            self.stock = stock
-            self.main_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_main.asp?pGB=1&gicode=A{stock}"
-            self.finance_url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Finance.asp?pGB=1&gicode=A{stock}"
+            self.stock = stock  # URL 프로퍼티는 self.stock 기준으로 생성됨
 
         # GCS 폴더 구조 설정 (파티션 기반: year=YYYY/quarter=Q/)
         today = date.today()
@@ -202,14 +663,15 @@ class FnGuideCrawler:
 
         # 캐시 사용 로직 (GCS가 사용 가능한 경우에만)
         if use_cache and self.gcs is not None:
-            # GCS에서 기존 파일 목록 수집
-            existing_files = self._collect_existing_files(
+            # GCS에서 기존 파일 목록 수집 (blocking 목록 조회가 다른 종목 크롤링을 막지 않도록 스레드에서 실행)
+            existing_files = await asyncio.to_thread(
+                self._collect_existing_files,
                 folder_name,
                 misspelled_folder,
                 legacy_folder,
             )
             # 캐시된 데이터 로드 시도
-            cached_data = self._load_from_gcs(
+            cached_data = await self._load_from_gcs(
                 folder_name,
                 file_base,
                 existing_files,
@@ -223,7 +685,8 @@ class FnGuideCrawler:
 
         # overwrite=False이고 아직 파일 목록을 가져오지 않았다면 수집
         if existing_files is None and not overwrite and self.gcs is not None:
-            existing_files = self._collect_existing_files(
+            existing_files = await asyncio.to_thread(
+                self._collect_existing_files,
                 folder_name,
                 misspelled_folder,
                 legacy_folder,
@@ -232,31 +695,36 @@ class FnGuideCrawler:
         # 데이터 수집
         raw_data = {}
 
-        # 1. Snapshot 정보 수집은 GCS에만 저장 (기존 호환성 유지)
-        snapshot_data = self._get_snapshot()
+        # 1. Snapshot 정보(GCS에만 저장, 기존 호환성 유지)와
+        # 2. 재무제표 3종을 동시에 수집
+        snapshot_data, finance_data = await asyncio.gather(
+            self._get_snapshot(),
+            self._get_finance(),
+            #self._get_finance_by_playwright(),
+        )
         raw_data.update(snapshot_data)
-
-        # 2. 재무제표 수집 (Playwright로 재무제표 3종)
-        finance_data = self._get_finance()
-        #finance_data = await self._get_finance_by_playwright()
         raw_data.update(finance_data)
 
-        # 3. GCS 업로드용 CSV 페이로드 생성
-        csv_payloads: dict[str, str] = {}
+        # 3. GCS 업로드용 CSV 페이로드 생성 (str을 거치지 않고 UTF-8 바이트로 바로 기록)
+        csv_payloads: dict[str, bytes] = {}
         for name, records in raw_data.items():
             if records:  # 빈 리스트가 아닐 때만 CSV 변환
                 try:
-                    df = pd.DataFrame(records)
-                    csv_payloads[name] = df.to_csv(index=False)
+                    buffer = BytesIO()
+                    # 줄바꿈을 고정해 실행 OS와 관계없이 같은 바이트(캐시/압축 결과)가 나오도록 함
+                    pd.DataFrame(records).to_csv(
+                        buffer, index=False, encoding="utf-8", lineterminator="\n"
+                    )
+                    csv_payloads[name] = buffer.getvalue()
                 except Exception as e:
                     print(f"'{name}' CSV 변환 실패: {e}")
-                    csv_payloads[name] = ""
+                    csv_payloads[name] = b""
             else:
-                csv_payloads[name] = ""
+                csv_payloads[name] = b""
 
         # 4. GCS에 업로드 (GCS가 사용 가능한 경우에만)
         if self.gcs is not None:
-            self.upload_to_gcs(
+            await self.upload_to_gcs(
                 csv_payloads,
                 folder_name=folder_name,
                 file_base=file_base,
@@ -278,42 +746,31 @@ class FnGuideCrawler:
         }
 
         # 디버깅: 수집된 동적 데이터 키 확인
-        print(f"[DEBUG] 수집된 동적 데이터 키: {list(finance_data.keys())}")
-        for key, value in finance_data.items():
-            if isinstance(value, list):
-                print(f"[DEBUG] {key}: {len(value)}개 레코드")
-            else:
-                print(f"[DEBUG] {key}: {type(value)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("수집된 동적 데이터 키: %s", list(finance_data))
+            for key, value in finance_data.items():
+                logger.debug("%s: %s", key, f"{len(value)}개 레코드" if isinstance(value, list) else type(value))
 
         # 재무상태표 (포괄손익계산서 → income_statement)
         if "포괄손익계산서" in finance_data and finance_data["포괄손익계산서"]:
-            result["income_statement"] = json.dumps(
-                finance_data["포괄손익계산서"],
-                ensure_ascii=False
-            )
-            print(f"[DEBUG] income_statement 변환 완료: {len(result['income_statement'])} bytes")
+            result["income_statement"] = _records_to_json(finance_data["포괄손익계산서"])
+            logger.debug("income_statement 변환 완료: %d bytes", len(result["income_statement"]))
         else:
-            print(f"[DEBUG] 포괄손익계산서 데이터 없음")
+            logger.debug("포괄손익계산서 데이터 없음")
 
         # 재무상태표
         if "재무상태표" in finance_data and finance_data["재무상태표"]:
-            result["balance_sheet"] = json.dumps(
-                finance_data["재무상태표"],
-                ensure_ascii=False
-            )
-            print(f"[DEBUG] balance_sheet 변환 완료: {len(result['balance_sheet'])} bytes")
+            result["balance_sheet"] = _records_to_json(finance_data["재무상태표"])
+            logger.debug("balance_sheet 변환 완료: %d bytes", len(result["balance_sheet"]))
         else:
-            print(f"[DEBUG] 재무상태표 데이터 없음")
+            logger.debug("재무상태표 데이터 없음")
 
         # 현금흐름표
         if "현금흐름표" in finance_data and finance_data["현금흐름표"]:
-            result["cash_flow"] = json.dumps(
-                finance_data["현금흐름표"],
-                ensure_ascii=False
-            )
-            print(f"[DEBUG] cash_flow 변환 완료: {len(result['cash_flow'])} bytes")
+            result["cash_flow"] = _records_to_json(finance_data["현금흐름표"])
+            logger.debug("cash_flow 변환 완료: %d bytes", len(result["cash_flow"]))
         else:
-            print(f"[DEBUG] 현금흐름표 데이터 없음")
+            logger.debug("현금흐름표 데이터 없음")
 
         return result
 
@@ -337,24 +794,15 @@ class FnGuideCrawler:
 
         # 포괄손익계산서 → income_statement
         if "포괄손익계산서" in cached_data and cached_data["포괄손익계산서"]:
-            result["income_statement"] = json.dumps(
-                cached_data["포괄손익계산서"],
-                ensure_ascii=False
-            )
+            result["income_statement"] = _records_to_json(cached_data["포괄손익계산서"])
 
         # 재무상태표 → balance_sheet
         if "재무상태표" in cached_data and cached_data["재무상태표"]:
-            result["balance_sheet"] = json.dumps(
-                cached_data["재무상태표"],
-                ensure_ascii=False
-            )
+            result["balance_sheet"] = _records_to_json(cached_data["재무상태표"])
 
         # 현금흐름표 → cash_flow
         if "현금흐름표" in cached_data and cached_data["현금흐름표"]:
-            result["cash_flow"] = json.dumps(
-                cached_data["현금흐름표"],
-                ensure_ascii=False
-            )
+            result["cash_flow"] = _records_to_json(cached_data["현금흐름표"])
 
         return result
 
@@ -391,213 +839,336 @@ class FnGuideCrawler:
             overwrite=overwrite,
         )
 
-    def _get_snapshot(self) -> dict[str, list[dict]]:
+    async def fundamentals_many(
+        self,
+        stocks: list[str],
+        *,
+        concurrency: int = 8,
+        use_cache: bool = False,
+        overwrite: bool = True,
+    ) -> list[dict[str, str | None] | BaseException]:
+        """
+        여러 종목의 재무제표를 동시에 수집
+
+        모든 종목이 공유 HTTP 클라이언트(HTTP/2, keep-alive)와 GCS 클라이언트를
+        함께 사용하므로 종목 수만큼 TCP/TLS 연결을 새로 맺지 않는다.
+
+        Args:
+            stocks: 종목 코드 리스트 (예: ["005930", "000660"])
+            concurrency: 동시에 수집할 최대 종목 수
+            use_cache: True일 경우 GCS에서 캐시된 데이터 조회 시도
+            overwrite: False일 경우 기존 파일이 있으면 덮어쓰지 않음
+
+        Returns:
+            list: 입력 순서대로의 get_all_fundamentals() 결과 (실패한 종목은 예외 객체)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        gcs = self.gcs
+
+        async def _one(stock: str) -> dict[str, str | None]:
+            # get_all_fundamentals()가 self.stock을 바꾸므로 종목마다 별도 인스턴스 사용
+            crawler = FnGuideCrawler(stock=stock, bucket_name=self.bucket_name)
+            crawler._gcs = gcs
+            crawler._gcs_initialized = True
+            async with semaphore:
+                return await crawler.get_all_fundamentals(
+                    use_cache=use_cache,
+                    overwrite=overwrite,
+                )
+
+        return await asyncio.gather(*(_one(stock) for stock in stocks), return_exceptions=True)
+
+    async def _get_snapshot(self) -> dict[str, list[dict]]:
         """
         기업 메인(Snapshot) 정보 수집
 
-        requests로 HTML을 가져온 후 pandas.read_html()로 파싱하여
+        httpx로 HTML을 가져온 후 lxml로 한 번만 파싱하여
         시장 상황, 지배구조, 주주 현황 등의 정적 데이터를 수집
 
         Returns:
             dict[str, list[dict]]: 테이블명을 키로 하는 레코드 딕셔너리
         """
-        response = requests.get(self.main_url)
-        response.raise_for_status()
-        tables = pd.read_html(StringIO(response.text))
+        content, encoding = await self._fetch_html(self.main_url)
+
+        return await self._run_parse(self._parse_snapshot, content, encoding, self.stock)
+
+    @staticmethod
+    async def _run_parse(func, *args) -> Any:
+        """
+        파싱 함수를 프로세스 풀에서 실행 (이벤트 루프와 GIL을 막지 않음)
+
+        Args:
+            func: 피클 가능한 파싱 함수 (클래스/정적 메서드)
+            *args: 함수 인자
+
+        Returns:
+            Any: 파싱 결과
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_parse_pool(), func, *args)
+
+    @staticmethod
+    def _parse_snapshot(
+        content: bytes,
+        encoding: str | None = None,
+        stock: str | None = None,
+    ) -> dict[str, list[dict]]:
+        """
+        Snapshot HTML 파싱
+
+        Args:
+            content: Snapshot 페이지 HTML 바이트
+            encoding: 응답 헤더의 charset
+            stock: 종목 코드 (회사명 컬럼 치환용)
 
-        datasets = self.fnguide_main.parse(tables, stock=self.stock)
+        Returns:
+            dict[str, list[dict]]: 테이블명을 키로 하는 레코드 딕셔너리
+        """
+        tables = _read_html_tables(content, encoding)
+
+        datasets = FnGuideMain().parse(tables, stock=stock)
 
         return datasets
 
 
-    def _get_finance(self) -> dict[str, list[dict]]:
+    async def _get_finance(self) -> dict[str, list[dict]]:
         """
-        재무제표 테이블 수집 (requests + BeautifulSoup 사용)
+        재무제표 테이블 수집 (httpx + lxml 사용)
 
         재무제표 3종(포괄손익계산서, 재무상태표, 현금흐름표)을
-        requests와 BeautifulSoup으로 크롤링하여 멀티인덱스 DataFrame으로 구조화
+        httpx와 lxml로 크롤링하여 멀티인덱스 DataFrame으로 구조화
+
+        Returns:
+            dict[str, list[dict]]: 테이블명을 키로 하는 레코드 딕셔너리
+        """
+        logger.info("페이지 요청 중: %s", self.finance_url)
+        content, encoding = await self._fetch_html(self.finance_url)
+
+        return await self._run_parse(self._parse_finance, content, encoding)
+
+    @classmethod
+    def _parse_finance(cls, content: bytes, encoding: str | None = None) -> dict[str, list[dict]]:
+        """
+        재무제표 HTML 파싱
+
+        Args:
+            content: 재무제표 페이지 HTML 바이트
+            encoding: 응답 헤더의 charset
 
         Returns:
             dict[str, list[dict]]: 테이블명을 키로 하는 레코드 딕셔너리
         """
         result_dict = {}
 
-        # requests로 페이지 가져오기
-        print(f"페이지 요청 중: {self.finance_url}")
-        response = requests.get(self.finance_url)
-        response.raise_for_status()
+        # 행 단위 디버그 출력은 DEBUG 레벨일 때만 포맷팅
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(response.text, "html.parser")
+        # 제목별 대상 테이블을 한 번의 순회로 찾은 뒤 각각 추출
+        tables = cls._locate_finance_tables(content, encoding)
 
         # 모든 테이블 데이터 수집
-        for title in self.finance_table_titles:
+        for title in cls.finance_table_titles:
+            target_table = tables.get(title)
+            if target_table is None:
+                logger.warning("%s 테이블을 찾을 수 없음", title)
+                result_dict[title] = []
+                continue
+
             try:
-                print(f"\n{title} 데이터 수집 중...")
-
-                # 해당 타이틀을 포함하는 테이블 찾기
-                tables = soup.find_all("table")
-                target_table = None
-                for table in tables:
-                    if title in table.get_text():
-                        target_table = table
-                        break
+                logger.debug("%s 데이터 수집 중...", title)
+                result_dict[title] = cls._extract_finance_table(title, target_table, debug=debug)
+            except Exception as e:
+                logger.error("%s 수집 실패: %s", title, e)
+                result_dict[title] = []
 
-                if not target_table:
-                    print(f"  - ⚠️ {title} 테이블을 찾을 수 없음")
-                    result_dict[title] = []
-                    continue
+        return result_dict
 
-                # 1. thead에서 날짜/기간 데이터 추출 (DataFrame의 index가 됨)
-                thead = target_table.find("thead")
-                if not thead:
-                    print(f"  - ⚠️ thead를 찾을 수 없음")
-                    result_dict[title] = []
-                    continue
+    @classmethod
+    def _locate_finance_tables(cls, content: bytes, encoding: str | None) -> dict[str, Any]:
+        """
+        재무제표 3종의 대상 테이블 찾기
 
-                # thead 내부의 각 행(tr)을 순회하면서 첫 번째 th(행 레이블)를 제외한 값을 수집한다.
-                thead_rows = thead.find_all("tr")
-                index_rows: list[list[str]] = []
-                for tr in thead_rows:
-                    row_headers = []
-                    ths = tr.find_all("th", recursive=False)
-                    for col_idx, th in enumerate(ths):
-                        text = th.get_text(strip=True)
-                        if not text:
-                            continue
+        charset을 알면 table 조각만 잘라 찾고, 남은 제목이 있으면 전체 페이지를
+        한 번 파싱하여 모든 table을 한 번만 순회하며 찾는다.
+        (제목마다 첫 번째로 해당 제목을 포함하는 테이블)
 
-                        # 대부분의 표에서 첫 번째 th는 행 구분(예: IFRS(연결))이므로 스킵한다.
-                        if col_idx == 0 and len(ths) > 1:
-                            continue
+        Args:
+            content: 재무제표 페이지 HTML 바이트
+            encoding: 응답 헤더의 charset
 
-                        colspan_attr = th.get("colspan")
-                        try:
-                            colspan = int(colspan_attr) if colspan_attr else 1
-                        except ValueError:
-                            colspan = 1
+        Returns:
+            dict[str, Any]: 제목 -> lxml table 요소 (찾지 못한 제목은 제외)
+        """
+        titles = cls.finance_table_titles
+        found = _find_table_fragments(content, titles, encoding) if encoding else {}
+
+        remaining = [title for title in titles if title not in found]
+        if remaining:
+            root = _parse_document(content, encoding)
+            for table in root.iter("table"):
+                text = table.text_content()
+                for title in [t for t in remaining if t in text]:
+                    found[title] = table
+                    remaining.remove(title)
+                if not remaining:
+                    break
 
-                        row_headers.extend([text] * colspan)
+        return found
 
-                    if row_headers:
-                        index_rows.append(row_headers)
+    @classmethod
+    def _extract_finance_table(cls, title: str, target_table, *, debug: bool = False) -> list[dict]:
+        """
+        재무제표 테이블 하나를 레코드 리스트로 변환
 
-                index_list = max(index_rows, key=len) if index_rows else []
+        thead에서 기간(인덱스)을, tbody에서 항목별 값을 추출하여
+        멀티인덱스 DataFrame으로 구조화한 뒤 레코드로 변환한다.
 
-                total_headers = sum(len(tr.find_all("th")) for tr in thead_rows)
-                print(
-                    f"  - 기간 데이터 (헤더 {total_headers}개 중 데이터 {len(index_list)}개): {index_list}"
-                )
+        Args:
+            title: 테이블 제목 (로그용)
+            target_table: lxml table 요소
+            debug: 행 단위 디버그 로그 출력 여부
+
+        Returns:
+            list[dict]: 기간별 레코드 리스트 (데이터가 없으면 빈 리스트)
+        """
+        # 1. thead에서 날짜/기간 데이터 추출 (DataFrame의 index가 됨)
+        thead = target_table.find(".//thead")
+        if thead is None:
+            logger.warning("%s: thead를 찾을 수 없음", title)
+            return []
+
+        # thead 내부의 각 행(tr)을 순회하면서 첫 번째 th(행 레이블)를 제외한 값을 수집한다.
+        thead_rows = thead.findall(".//tr")
+        index_rows: list[list[str]] = []
+        for tr in thead_rows:
+            row_headers = []
+            ths = tr.findall("th")
+            for col_idx, th in enumerate(ths):
+                text = _stripped_text(th)
+                if not text:
+                    continue
 
-                # 2. tbody에서 항목별 데이터 수집
-                data_dict = {}  # {컬럼명_튜플: [값들]}
-                print(f"  - tbody 데이터 추출 중...")
+                # 대부분의 표에서 첫 번째 th는 행 구분(예: IFRS(연결))이므로 스킵한다.
+                if col_idx == 0 and len(ths) > 1:
+                    continue
 
-                tbody = target_table.find("tbody")
-                if not tbody:
-                    print(f"  - ⚠️ tbody를 찾을 수 없음")
-                    data_dict = {}
-                else:
-                    tbody_trs = tbody.find_all("tr", recursive=False)
-                    print(f"  - 발견된 행 수: {len(tbody_trs)}")
+                colspan_attr = th.get("colspan")
+                try:
+                    colspan = int(colspan_attr) if colspan_attr else 1
+                except ValueError:
+                    colspan = 1
 
-                    # 디버깅: 첫 번째 행의 HTML 구조 확인
-                    if tbody_trs:
-                        print(f"  - [DEBUG] 첫 행 HTML: {str(tbody_trs[0])[:500]}")
+                row_headers.extend([text] * colspan)
 
-                    # 마지막으로 나온 span 텍스트를 저장 (상위 카테고리 추적용)
-                    last_span_text = None
-                    processed_count = 0
+            if row_headers:
+                index_rows.append(row_headers)
 
-                    for idx, tr in enumerate(tbody_trs):
-                        if idx % 20 == 0:  # 20개마다 진행상황 출력
-                            print(f"  - 처리 중: {idx}/{len(tbody_trs)} 행")
+        index_list = max(index_rows, key=len) if index_rows else []
 
-                        try:
-                            # th 직접 찾기 (div 없이)
-                            th = tr.find("th")
-                            if not th:
-                                if idx < 3:
-                                    print(
-                                        f"  - [DEBUG] 행 {idx}: th 없음, HTML: {str(tr)[:200]}"
-                                    )
-                                continue
-
-                            span = th.find("span")
-                            column_name_tuple = None
-
-                            # 1. span이 존재하는 경우: 새로운 상위 카테고리 시작
-                            if span:
-                                span_text = span.get_text(strip=True)
-                                th_text = th.get_text(strip=True)
-                                last_span_text = span_text
-                                column_name_tuple = (span_text, th_text)
-                                if idx < 3:
-                                    print(
-                                        f"  - [DEBUG] 행 {idx} (span): {column_name_tuple}"
-                                    )
-                            # 2. span은 없지만 th가 존재하는 경우
-                            else:
-                                th_text = th.get_text(strip=True)
-                                if last_span_text:
-                                    column_name_tuple = (last_span_text, th_text)
-                                else:
-                                    column_name_tuple = (th_text, "")
-                                if idx < 3:
-                                    print(
-                                        f"  - [DEBUG] 행 {idx} (no span): {column_name_tuple}"
-                                    )
-
-                            # td 값들 추출 (각 기간별 데이터)
-                            tds = tr.find_all("td", recursive=False)
-                            values = [td.get_text(strip=True) for td in tds]
-
-                            if idx < 3:
-                                print(
-                                    f"  - [DEBUG] 행 {idx} td 개수: {len(tds)}, 값: {values[:3] if values else '없음'}"
-                                )
+        if debug:
+            total_headers = sum(len(tr.findall(".//th")) for tr in thead_rows)
+            logger.debug(
+                "  - 기간 데이터 (헤더 %d개 중 데이터 %d개): %s",
+                total_headers, len(index_list), index_list,
+            )
 
-                            # 데이터 딕셔너리에 추가 (값이 있는 경우만)
-                            if column_name_tuple and values:
-                                # 헤더 개수와 값 개수가 일치하는지 확인
-                                if len(values) == len(index_list):
-                                    data_dict[column_name_tuple] = values
-                                    processed_count += 1
-                                    if idx < 3:
-                                        print(f"  - [DEBUG] 행 {idx} 성공!")
-                                else:
-                                    # 길이가 다른 경우 디버깅 정보 출력
-                                    if idx < 5:  # 처음 5개만 출력
-                                        print(
-                                            f"  - ⚠️ 행 {idx} 길이 불일치: 헤더={len(index_list)}, 값={len(values)} (스킵)"
-                                        )
-
-                        except Exception as e:
-                            if idx < 5:  # 처음 5개만 출력
-                                print(f"  - 행 {idx} 처리 중 에러: {e}")
-                            continue
+        # 2. tbody에서 항목별 데이터 수집
+        # 행(항목)별 값은 미리 할당한 2차원 배열에 바로 채우고,
+        # 항목 튜플 -> 배열 행 위치를 기록 (같은 항목이 다시 나오면 덮어씀)
+        positions: dict[tuple[str, str], int] = {}
 
-                    print(f"  - 처리 완료: {processed_count}/{len(tbody_trs)} 행")
+        tbody = target_table.find(".//tbody")
+        if tbody is None:
+            logger.warning("%s: tbody를 찾을 수 없음", title)
+        else:
+            tbody_trs = tbody.findall("tr")
+            logger.debug("  - 발견된 행 수: %d", len(tbody_trs))
+            values_grid = np.empty((len(tbody_trs), len(index_list)), dtype=object)
 
-                # 3. DataFrame 생성
-                if data_dict and index_list:
-                    df = pd.DataFrame(data_dict, index=index_list)
+            # 디버깅: 첫 번째 행의 HTML 구조 확인
+            if debug and tbody_trs:
+                logger.debug("  - 첫 행 HTML: %s", _outer_html(tbody_trs[0])[:500])
 
-                    # 4. 멀티인덱스로 columns 변환
-                    #    예: ("유동자산", "현금및현금성자산"), ("유동자산", "단기투자자산") ...
-                    df.columns = pd.MultiIndex.from_tuples(df.columns)
+            # 마지막으로 나온 span 텍스트를 저장 (상위 카테고리 추적용)
+            last_span_text = None
+            processed_count = 0
 
-                    result_dict[title] = self._dataframe_to_records(df)
-                    print(f"  - 완료! DataFrame shape: {df.shape}")
-                else:
-                    print(f"  - 데이터 없음")
-                    result_dict[title] = []
+            for idx, tr in enumerate(tbody_trs):
+                try:
+                    # th 직접 찾기 (div 없이)
+                    th = tr.find(".//th")
+                    if th is None:
+                        if debug and idx < 3:
+                            logger.debug("  - 행 %d: th 없음, HTML: %s", idx, _outer_html(tr)[:200])
+                        continue
+
+                    span = th.find(".//span")
+                    column_name_tuple = None
+
+                    # 1. span이 존재하는 경우: 새로운 상위 카테고리 시작
+                    if span is not None:
+                        span_text = _stripped_text(span)
+                        th_text = _stripped_text(th)
+                        last_span_text = span_text
+                        column_name_tuple = (span_text, th_text)
+                        if debug and idx < 3:
+                            logger.debug("  - 행 %d (span): %s", idx, column_name_tuple)
+                    # 2. span은 없지만 th가 존재하는 경우
+                    else:
+                        th_text = _stripped_text(th)
+                        if last_span_text:
+                            column_name_tuple = (last_span_text, th_text)
+                        else:
+                            column_name_tuple = (th_text, "")
+                        if debug and idx < 3:
+                            logger.debug("  - 행 %d (no span): %s", idx, column_name_tuple)
+
+                    # td 값들 추출 (각 기간별 데이터)
+                    tds = tr.findall("td")
+                    values = [_stripped_text(td) for td in tds]
+
+                    if debug and idx < 3:
+                        logger.debug("  - 행 %d td 개수: %d, 값: %s", idx, len(tds), values[:3] or "없음")
+
+                    # 데이터 딕셔너리에 추가 (값이 있는 경우만)
+                    if column_name_tuple and values:
+                        # 헤더 개수와 값 개수가 일치하는지 확인
+                        if len(values) == len(index_list):
+                            position = positions.setdefault(column_name_tuple, len(positions))
+                            values_grid[position] = values
+                            processed_count += 1
+                            if debug and idx < 3:
+                                logger.debug("  - 행 %d 성공!", idx)
+                        else:
+                            # 길이가 다른 경우 디버깅 정보 출력
+                            if debug and idx < 5:  # 처음 5개만 출력
+                                logger.debug(
+                                    "  - 행 %d 길이 불일치: 헤더=%d, 값=%d (스킵)",
+                                    idx, len(index_list), len(values),
+                                )
 
-            except Exception as e:
-                print(f"{title} 수집 실패: {e}")
-                result_dict[title] = []
+                except Exception as e:
+                    if idx < 5:  # 처음 5개만 출력
+                        logger.warning("%s 행 %d 처리 중 에러: %s", title, idx, e)
+                    continue
 
-        return result_dict
-    
+            logger.debug("  - 처리 완료: %d/%d 행", processed_count, len(tbody_trs))
+
+        # 3. DataFrame 생성
+        if positions and index_list:
+            # 4. 배열을 전치하여 한 번에 생성 (행=기간, 컬럼=멀티인덱스 항목)
+            #    예: ("유동자산", "현금및현금성자산"), ("유동자산", "단기투자자산") ...
+            df = pd.DataFrame(
+                values_grid[: len(positions)].T,
+                index=index_list,
+                columns=pd.MultiIndex.from_tuples(list(positions)),
+            )
+
+            logger.debug("  - 완료! DataFrame shape: %s", df.shape)
+            return cls._dataframe_to_records(df)
+
+        logger.debug("  - %s 데이터 없음", title)
+        return []
 
     async def _get_finance_by_playwright(self) -> dict[str, list[dict]]:
         """
@@ -656,172 +1227,67 @@ class FnGuideCrawler:
                             await button.click(force=True)
                             await page.wait_for_timeout(500)
                         except:
-                            print(f"버튼 클릭 실패, 다음으로 진행")
+                            logger.debug("버튼 클릭 실패, 다음으로 진행")
                             await page.wait_for_timeout(500)
                             continue
 
                 except Exception as e:
-                    print(e)
+                    logger.warning("아코디언 버튼 처리 중 에러: %s", e)
                     break
 
-            # 모든 테이블 데이터 수집
+            # 렌더링된 table HTML만 먼저 모두 수집 (파싱은 브라우저 작업과 분리)
+            table_htmls: dict[str, str] = {}
             for title in self.finance_table_titles:
                 try:
-                    print(f"\n{title} 데이터 수집 중...")
-                    table_locator = page.locator("table:visible").filter(has_text=title)
-
-                    # 1. thead에서 날짜/기간 데이터 추출 (DataFrame의 index가 됨)
-                    # thead의 HTML을 가져와서 파싱
-                    thead_html = await table_locator.locator("thead:visible").inner_html()
-                    thead_soup = BeautifulSoup(thead_html, 'html.parser')
-
-                    # thead 내부의 각 행(tr)을 순회하면서 첫 번째 th(행 레이블)를 제외한 값을 수집한다.
-                    thead_rows = thead_soup.find_all('tr')
-                    index_rows: list[list[str]] = []
-                    for tr in thead_rows:
-                        row_headers = []
-                        ths = tr.find_all('th', recursive=False)
-                        for col_idx, th in enumerate(ths):
-                            text = th.get_text(strip=True)
-                            if not text:
-                                continue
-
-                            # 대부분의 표에서 첫 번째 th는 행 구분(예: IFRS(연결))이므로 스킵한다.
-                            if col_idx == 0 and len(ths) > 1:
-                                continue
-
-                            colspan_attr = th.get('colspan')
-                            try:
-                                colspan = int(colspan_attr) if colspan_attr else 1
-                            except ValueError:
-                                colspan = 1
-
-                            row_headers.extend([text] * colspan)
-
-                        if row_headers:
-                            index_rows.append(row_headers)
-
-                    index_list = max(index_rows, key=len) if index_rows else []
-
-                    total_headers = sum(len(tr.find_all('th')) for tr in thead_rows)
-                    print(f"  - 기간 데이터 (헤더 {total_headers}개 중 데이터 {len(index_list)}개): {index_list}")
-
-                    # 2. tbody에서 항목별 데이터 수집 (HTML 한 번에 가져와서 파싱)
-                    data_dict = {}  # {컬럼명_튜플: [값들]}
-                    print(f"  - tbody 데이터 추출 중...")
+                    logger.debug("%s 데이터 수집 중...", title)
+                    table_locator = page.locator("table:visible").filter(has_text=title).first
+                    table_htmls[title] = await table_locator.evaluate("el => el.outerHTML")
+                except Exception as e:
+                    logger.error("%s 수집 실패: %s", title, e)
+                    result_dict[title] = []
 
-                    try:
-                        # 테이블 전체 HTML을 한 번에 가져오기
-                        table_html = await table_locator.inner_html()
+            await browser.close()
 
-                        # BeautifulSoup으로 파싱
-                        soup = BeautifulSoup(table_html, 'html.parser')
-                        tbody = soup.find('tbody')
+        # 행 단위 디버그 출력은 DEBUG 레벨일 때만 포맷팅
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # 행 단위 파싱은 이벤트 루프를 막지 않도록 프로세스 풀에서 테이블별로 동시에 실행
+        # (httpx 경로와 같은 lxml 추출 로직 사용)
+        titles = list(table_htmls)
+        parsed = await asyncio.gather(
+            *(
+                self._run_parse(self._parse_finance_table_html, title, table_htmls[title], debug)
+                for title in titles
+            ),
+            return_exceptions=True,
+        )
+        for title, records in zip(titles, parsed):
+            if isinstance(records, Exception):
+                logger.error("%s 수집 실패: %s", title, records)
+                records = []
+            result_dict[title] = records
 
-                        if not tbody:
-                            print(f"  - ⚠️ tbody를 찾을 수 없음")
-                            data_dict = {}
-                        else:
-                            tbody_trs = tbody.find_all('tr', recursive=False)
-                            print(f"  - 발견된 행 수: {len(tbody_trs)}")
-
-                            # 디버깅: 첫 번째 행의 HTML 구조 확인
-                            if tbody_trs:
-                                print(f"  - [DEBUG] 첫 행 HTML: {str(tbody_trs[0])[:500]}")
-
-                            # 마지막으로 나온 span 텍스트를 저장 (상위 카테고리 추적용)
-                            last_span_text = None
-                            processed_count = 0
-
-                            for idx, tr in enumerate(tbody_trs):
-                                if idx % 20 == 0:  # 20개마다 진행상황 출력
-                                    print(f"  - 처리 중: {idx}/{len(tbody_trs)} 행")
-
-                                try:
-                                    # th 직접 찾기 (div 없이)
-                                    th = tr.find('th')
-                                    if not th:
-                                        if idx < 3:
-                                            print(f"  - [DEBUG] 행 {idx}: th 없음, HTML: {str(tr)[:200]}")
-                                        continue
-
-                                    span = th.find('span')
-                                    column_name_tuple = None
-
-                                    # 1. span이 존재하는 경우: 새로운 상위 카테고리 시작
-                                    if span:
-                                        span_text = span.get_text(strip=True)
-                                        th_text = th.get_text(strip=True)
-                                        last_span_text = span_text
-                                        column_name_tuple = (span_text, th_text)
-                                        if idx < 3:
-                                            print(f"  - [DEBUG] 행 {idx} (span): {column_name_tuple}")
-                                    # 2. span은 없지만 th가 존재하는 경우
-                                    else:
-                                        th_text = th.get_text(strip=True)
-                                        if last_span_text:
-                                            column_name_tuple = (last_span_text, th_text)
-                                        else:
-                                            column_name_tuple = (th_text, "")
-                                        if idx < 3:
-                                            print(f"  - [DEBUG] 행 {idx} (no span): {column_name_tuple}")
-
-                                    # td 값들 추출 (각 기간별 데이터)
-                                    tds = tr.find_all('td', recursive=False)
-                                    values = [td.get_text(strip=True) for td in tds]
-
-                                    if idx < 3:
-                                        print(f"  - [DEBUG] 행 {idx} td 개수: {len(tds)}, 값: {values[:3] if values else '없음'}")
-
-                                    # 데이터 딕셔너리에 추가 (값이 있는 경우만)
-                                    if column_name_tuple and values:
-                                        # 헤더 개수와 값 개수가 일치하는지 확인
-                                        if len(values) == len(index_list):
-                                            data_dict[column_name_tuple] = values
-                                            processed_count += 1
-                                            if idx < 3:
-                                                print(f"  - [DEBUG] 행 {idx} 성공!")
-                                        else:
-                                            # 길이가 다른 경우 디버깅 정보 출력
-                                            if idx < 5:  # 처음 5개만 출력
-                                                print(f"  - ⚠️ 행 {idx} 길이 불일치: 헤더={len(index_list)}, 값={len(values)} (스킵)")
-
-                                except Exception as e:
-                                    if idx < 5:  # 처음 5개만 출력
-                                        print(f"  - 행 {idx} 처리 중 에러: {e}")
-                                    continue
-
-                            print(f"  - 처리 완료: {processed_count}/{len(tbody_trs)} 행")
-
-                    except Exception as e:
-                        print(f"  - ⚠️ tbody 데이터 수집 실패: {e}")
-                        data_dict = {}
-
-                    # 3. DataFrame 생성
-                    if data_dict and index_list:
-                        df = pd.DataFrame(data_dict, index=index_list)
-
-                        # 4. 멀티인덱스로 columns 변환
-                        #    예: ("유동자산", "현금및현금성자산"), ("유동자산", "단기투자자산") ...
-                        df.columns = pd.MultiIndex.from_tuples(df.columns)
-
-                        result_dict[title] = self._dataframe_to_records(df)
-                        print(f"  - 완료! DataFrame shape: {df.shape}")
-                    else:
-                        print(f"  - 데이터 없음")
-                        result_dict[title] = []
+        return {title: result_dict[title] for title in self.finance_table_titles}
 
-                except Exception as e:
-                    print(f"{title} 수집 실패: {e}")
-                    result_dict[title] = []
+    @classmethod
+    def _parse_finance_table_html(cls, title: str, table_html: str, debug: bool = False) -> list[dict]:
+        """
+        재무제표 table HTML 하나를 레코드 리스트로 변환 (Playwright 경로용)
 
-            await browser.close()
+        Args:
+            title: 테이블 제목 (로그용)
+            table_html: 렌더링된 table 요소의 outerHTML
+            debug: 행 단위 디버그 로그 출력 여부
 
-        return result_dict
+        Returns:
+            list[dict]: 기간별 레코드 리스트 (데이터가 없으면 빈 리스트)
+        """
+        target_table = lxml.html.fragment_fromstring(table_html)
+        return cls._extract_finance_table(title, target_table, debug=debug)
 
     # ==================== GCS 연동 메서드 ====================
 
-    def _load_from_gcs(
+    async def _load_from_gcs(
         self,
         folder_name: str,
         file_base: str,
@@ -842,7 +1308,8 @@ class FnGuideCrawler:
         """
         if existing_files is None:
             alias_folder = self._partition_alias(folder_name)
-            existing_files = self._collect_existing_files(
+            existing_files = await asyncio.to_thread(
+                self._collect_existing_files,
                 folder_name,
                 alias_folder,
                 legacy_folder,
@@ -851,18 +1318,12 @@ class FnGuideCrawler:
         cached_data: dict[str, list[dict]] = {}
 
         # 정적 + 동적 테이블 모두 확인
-        all_table_names = [name for name, _ in FnGuideMain.main_table_selectors] + self.finance_table_titles
+        all_table_names = self._all_table_names
 
+        # 1. 테이블별로 실제 존재하는 파일 찾기
+        selected_blobs: list[str] = []
         for name in all_table_names:
-            new_blob = f"{folder_name}{file_base}_{name}.csv"
-            candidate_names = self._expand_candidates(new_blob)
-            candidate_names.extend(
-                self._legacy_candidate_blobs(
-                    name=name,
-                    file_base=file_base,
-                    existing_files=existing_files,
-                )
-            )
+            candidate_names = self._candidates_for(folder_name, file_base, name)
 
             # 후보 중 실제 존재하는 파일 찾기
             selected_blob = self._resolve_existing_blob(
@@ -871,34 +1332,57 @@ class FnGuideCrawler:
             )
             if not selected_blob:
                 return None  # 하나라도 없으면 전체 캐시 무효
+            selected_blobs.append(selected_blob)
 
-            # GCS에서 파일 읽기
-            content = self.gcs.read_file(selected_blob)
-            if content is None:
-                return None
+        # 2. GCS에서 파일 동시 읽기/파싱 (blob마다 왕복 지연이 있으므로 순차 대신 병렬)
+        tables = await asyncio.gather(
+            *(asyncio.to_thread(self._read_cached_table, blob) for blob in selected_blobs)
+        )
 
-            # CSV 또는 JSON 파싱
-            if selected_blob.endswith(".csv"):
-                try:
-                    frame = pd.read_csv(StringIO(content))
-                except pd.errors.EmptyDataError:
-                    frame = pd.DataFrame()
-                cached_data[name] = frame.to_dict(orient="records")
-            else:
-                try:
-                    payload = json.loads(content)
-                except json.JSONDecodeError:
-                    return None
-                if isinstance(payload, list):
-                    cached_data[name] = payload
-                else:
-                    cached_data[name] = []
+        for name, records in zip(all_table_names, tables):
+            if records is None:
+                return None
+            cached_data[name] = records
 
         return cached_data
 
-    def upload_to_gcs(
+    def _read_cached_table(self, blob_name: str) -> list[dict] | None:
+        """
+        GCS의 캐시 파일(CSV 또는 JSON) 하나를 스트림으로 읽어 레코드로 변환
+
+        파일 전체를 문자열로 만들지 않고 blob 읽기 스트림을 바로 파싱한다.
+
+        Args:
+            blob_name: 실제 blob 경로
+
+        Returns:
+            list[dict] | None: 레코드 리스트 또는 None (읽기/파싱 실패)
+        """
+        fp = self.gcs.open_file(blob_name)
+        if fp is None:
+            return None
+
+        with fp:
+            # gzip으로 업로드된 파일은 스트림 단위로 압축 해제
+            compressed = fp.read(2) == b"\x1f\x8b"
+            fp.seek(0)
+            stream = gzip.GzipFile(fileobj=fp) if compressed else fp
+
+            if blob_name.endswith(".csv"):
+                # DataFrame을 거치지 않고 바로 레코드로 읽음 (값은 새로 수집한 레코드처럼 문자열 유지)
+                return list(
+                    csv.DictReader(TextIOWrapper(stream, encoding="utf-8", newline=""))
+                )
+
+            try:
+                payload = orjson.loads(stream.read())
+            except orjson.JSONDecodeError:
+                return None
+            return payload if isinstance(payload, list) else []
+
+    async def upload_to_gcs(
         self,
-        serialized_payloads: dict[str, str],
+        serialized_payloads: dict[str, bytes],
         *,
         folder_name: str,
         file_base: str,
@@ -910,7 +1394,7 @@ class FnGuideCrawler:
         CSV 페이로드를 GCS에 업로드
 
         Args:
-            serialized_payloads: {테이블명: CSV 문자열} 딕셔너리
+            serialized_payloads: {테이블명: CSV 바이트(UTF-8)} 딕셔너리 (gzip 압축 후 업로드)
             folder_name: 업로드 폴더 경로
             file_base: 파일명 접두사 (종목 코드)
             existing_files: 기존 파일 목록
@@ -925,41 +1409,53 @@ class FnGuideCrawler:
         if existing_files is None:
             alias_folder = self._partition_alias(folder_name) if not overwrite else None
             collect_legacy = legacy_folder if not overwrite else None
-            existing_files = self._collect_existing_files(
+            existing_files = await asyncio.to_thread(
+                self._collect_existing_files,
                 folder_name,
                 alias_folder,
                 collect_legacy,
             )
 
         # 폴더 생성 (플레이스홀더 파일)
-        self.gcs.ensure_folder(folder_name)
+        await asyncio.to_thread(self.gcs.ensure_folder, folder_name)
 
+        # 업로드 대상 선별 (blob 이름, CSV 바이트)
+        uploads: list[tuple[str, bytes]] = []
         for name, payload in serialized_payloads.items():
             new_blob = f"{folder_name}{file_base}_{name}.csv"
-            candidate_names = self._expand_candidates(new_blob)
-            candidate_names.extend(
-                self._legacy_candidate_blobs(
-                    name=name,
-                    file_base=file_base,
-                    existing_files=existing_files,
-                )
-            )
 
             # overwrite=False이고 이미 파일이 있으면 스킵
             if not overwrite:
+                candidate_names = self._candidates_for(folder_name, file_base, name)
                 if self._resolve_existing_blob(candidate_names, existing_files):
                     continue
 
-            # GCS 업로드
-            target_blob_name = new_blob.lstrip("/")
-            uploaded = self.gcs.upload_file(
-                source_file=payload,
-                destination_blob_name=target_blob_name,
-                encoding="utf-8",
-                content_type="text/csv; charset=utf-8",
+            # 반복이 많은 CSV 텍스트는 gzip으로 크게 줄어들므로 압축해서 전송/저장
+            uploads.append(
+                (new_blob.lstrip("/"), gzip.compress(payload, compresslevel=GCS_GZIP_LEVEL))
             )
 
-            # 업로드 성공 시 파일 목록 갱신
+        if not uploads:
+            return
+
+        # GCS 업로드는 왕복 지연이 대부분이므로 파일들을 동시에 업로드 (GCS 요청 한도 고려해 동시 수 제한)
+        semaphore = asyncio.Semaphore(GCS_UPLOAD_WORKERS)
+
+        async def _upload(target_blob_name: str, payload: bytes) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.gcs.upload_file,
+                    source_file=payload,
+                    destination_blob_name=target_blob_name,
+                    encoding="utf-8",
+                    content_type="text/csv; charset=utf-8",
+                    content_encoding="gzip",
+                )
+
+        results = await asyncio.gather(*(_upload(blob, payload) for blob, payload in uploads))
+
+        # 업로드 성공 시 파일 목록 갱신
+        for (target_blob_name, _), uploaded in zip(uploads, results):
             if uploaded and existing_files is not None:
                 existing_files[target_blob_name] = target_blob_name
                 normalized = target_blob_name.lstrip("/")
@@ -985,8 +1481,12 @@ class FnGuideCrawler:
             dict[str, str]: {blob 이름 변형: 실제 blob 경로} 매핑
         """
         mapping: dict[str, str] = {}
+        legacy_index: dict[str, list[tuple[str, list[str]]]] = {}
         seen_folders: set[str] = set()
 
+        # 레거시 후보는 파일 목록에 따라 달라지므로 새로 수집할 때 후보 캐시를 비움
+        self._candidate_cache.clear()
+
         for candidate_folder in (primary_folder, *additional_folders):
             if not candidate_folder or candidate_folder in seen_folders:
                 continue
@@ -995,12 +1495,66 @@ class FnGuideCrawler:
             # GCS에서 폴더 내 파일 목록 가져오기
             for blob_name in self.gcs.list_files(folder_name=candidate_folder):
                 mapping.setdefault(blob_name, blob_name)
-                # 앞의 '/' 제거한 버전도 매핑에 추가
+                # 앞의 '/'를 제거한 버전과 붙인 버전도 매핑에 추가
+                # (조회 시 후보마다 다시 정규화하지 않고 바로 찾을 수 있도록)
                 normalized = blob_name.lstrip("/")
                 mapping.setdefault(normalized, blob_name)
+                mapping.setdefault(f"/{normalized}", blob_name)
 
+                # 레거시 파일은 테이블명으로 색인 (새 파티션 폴더는 제외)
+                if normalized.startswith("Fundamentals/FnGuide/year="):
+                    continue
+                match = _LEGACY_BLOB_RE.search(normalized)
+                if match is None:
+                    continue
+                # "{종목}_{테이블명}" 형식이고 테이블명에도 '_'가 있을 수 있으므로
+                # '_' 뒤의 모든 접미사를 테이블명 후보로 등록
+                basename = match[1]
+                entry = (blob_name, self._expand_candidates(blob_name))
+                pos = basename.find("_")
+                while pos != -1:
+                    entries = legacy_index.setdefault(basename[pos + 1:], [])
+                    if not entries or entries[-1][0] != blob_name:
+                        entries.append(entry)
+                    pos = basename.find("_", pos + 1)
+
+        self._legacy_index = legacy_index
         return mapping
 
+    def _candidates_for(
+        self,
+        folder_name: str,
+        file_base: str,
+        name: str,
+    ) -> tuple[str, ...]:
+        """
+        테이블 하나의 후보 blob 이름 (현재 파티션 + 레거시) 조회
+
+        캐시 로드와 업로드에서 같은 테이블 후보를 다시 만들지 않도록 인스턴스에 캐시한다.
+        (파일 목록을 새로 수집하면 _collect_existing_files에서 캐시를 비움)
+
+        Args:
+            folder_name: 현재 파티션 폴더 경로
+            file_base: 파일명 접두사 (종목 코드)
+            name: 테이블명
+
+        Returns:
+            tuple[str, ...]: 후보 blob 이름들
+        """
+        key = (folder_name, file_base, name)
+        candidates = self._candidate_cache.get(key)
+        if candidates is None:
+            new_blob = f"{folder_name}{file_base}_{name}.csv"
+            candidates = (
+                *self._expand_candidates(new_blob),
+                *self._legacy_candidate_blobs(
+                    name=name,
+                    file_base=file_base,
+                ),
+            )
+            self._candidate_cache[key] = candidates
+        return candidates
+
     def _expand_candidates(self, blob_name: str) -> list[str]:
         """
         Blob 이름 정규화 후보 생성
@@ -1023,56 +1577,37 @@ class FnGuideCrawler:
         *,
         name: str,
         file_base: str,
-        existing_files: dict[str, str],
     ) -> list[str]:
         """
         레거시 폴더 구조의 후보 blob 탐색
 
         구 폴더 구조(/Fundamentals/FnGuide/{stock}/{year}-Q{quarter}/raw/)에서
-        해당 테이블 파일이 있는지 확인
+        해당 테이블 파일이 있는지 확인 (_collect_existing_files에서 만든 인덱스 조회)
 
         Args:
             name: 테이블명
             file_base: 종목 코드
-            existing_files: 기존 파일 목록
 
         Returns:
             list[str]: 레거시 후보 blob 경로 리스트
         """
-        suffixes = (f"_{name}.json", f"_{name}.csv")
         matches: list[str] = []
-        seen: set[str] = set()
-
-        for key, actual in existing_files.items():
-            if actual in seen:
-                continue
-            normalized_key = key.lstrip("/")
-
+        for actual, candidates in self._legacy_index.get(name, ()):
             # 종목 코드가 포함되어 있는지 확인
-            if file_base not in normalized_key:
-                continue
-
-            # 테이블명 확장자로 끝나는지 확인
-            if not normalized_key.endswith(suffixes):
-                continue
-
-            # 새 파티션 폴더는 제외 (레거시만)
-            if normalized_key.startswith("Fundamentals/FnGuide/year="):
-                continue
-
-            seen.add(actual)
-            matches.extend(self._expand_candidates(actual))
-
+            if file_base in actual:
+                matches.extend(candidates)
         return matches
 
     def _resolve_existing_blob(
         self,
-        candidate_names: list[str],
+        candidate_names: tuple[str, ...] | list[str],
         existing_files: dict[str, str],
     ) -> str | None:
         """
         후보 blob 중 실제 존재하는 blob 반환
 
+        existing_files에는 '/' 유무 변형이 모두 들어 있으므로 후보당 한 번만 조회한다.
+
         Args:
             candidate_names: 후보 blob 이름 리스트
             existing_files: 기존 파일 목록
@@ -1080,16 +1615,16 @@ class FnGuideCrawler:
         Returns:
             str | None: 실제 존재하는 blob 경로 또는 None
         """
+        get = existing_files.get
         for candidate in candidate_names:
-            if candidate in existing_files:
-                return existing_files[candidate]
-            normalized = candidate.lstrip("/")
-            if normalized in existing_files:
-                return existing_files[normalized]
+            actual = get(candidate)
+            if actual is not None:
+                return actual
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _legacy_folder_from_current(
-        self,
         folder_name: str,
         *,
         stock: str,
@@ -1099,6 +1634,8 @@ class FnGuideCrawler:
         """
         현재 파티션 폴더로부터 레거시 폴더 경로 생성
 
+        같은 파티션의 여러 종목을 처리할 때 문자열 작업이 반복되지 않도록 결과를 캐시한다.
+
         새 구조: Fundamentals/FnGuide/year=2025/quarter=1/
         레거시: /Fundamentals/FnGuide/005930/2025-Q1/raw/
 
@@ -1132,11 +1669,13 @@ class FnGuideCrawler:
 
         return f"/Fundamentals/FnGuide/{stock}/{legacy_quarter}/raw/"
 
-    def _partition_alias(self, folder_name: str) -> str | None:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _partition_alias(folder_name: str) -> str | None:
         """
         오타 폴더명 (quater → quarter) 처리
 
-        초기 구현에서 "quarter" 대신 "quater"로 오타가 있었던 것을 지원
+        초기 구현에서 "quarter" 대신 "quater"로 오타가 있었던 것을 지원 (결과는 폴더별로 캐시)
 
         Args:
             folder_name: 원본 폴더 경로
@@ -1149,6 +1688,36 @@ class FnGuideCrawler:
         return folder_name.replace(QUARTER_PREFIX, "quater=")
 
 
+# FnGuide 한글 → 영문 컬럼명 매핑 딕셔너리
+_COLUMN_MAP = {
+    "잠정실적발표예정일": "tentative_results_announcement_date",
+    "예상실적(영업이익, 억원)": "expected_operating_profit_billion_krw",
+    "3개월전예상실적대비(%)": "expected_operating_profit_vs_3m_pct",
+    "전년동기대비(%)": "year_over_year_pct",
+    "운용사명": "asset_manager_name",
+    "보유수량": "shares_held",
+    "시가평가액": "market_value_krw",
+    "상장주식수내비중": "share_of_outstanding_shares_pct",
+    "운용사내비중": "manager_portfolio_ratio_pct",
+    "항목": "item",
+    "보통주": "common_shares",
+    "지분율": "ownership_ratio_pct",
+    "최종변동일": "last_change_date",
+    "주주구분": "shareholder_category",
+    "대표주주수": "major_shareholder_count",
+    "투자의견": "investment_opinion",
+    "목표주가": "target_price",
+    "추정기관수": "estimate_institution_count",
+    "구분": "category",
+    "코스피 전기·전자": "kospi_electronics",
+    "헤더": "header",
+    "헤더.1": "header_1",
+    "IFRS(연결)": "ifrs_consolidated",
+    "IFRS(별도)": "ifrs_individual",
+}
+_COLUMN_MAP_GET = _COLUMN_MAP.get
+
+
 class FnGuideMain:
     """
     FnGuide 한글 컬럼명을 영문으로 번역하는 헬퍼 클래스
@@ -1157,8 +1726,8 @@ class FnGuideMain:
     데이터 분석 시 일관성 있는 컬럼명 사용 가능
     """
 
-    # Snapshot HTML에서 가져올 테이블 (원본 utils/fnguide.py)
-    _main_table_selectors = [
+    # Snapshot HTML에서 가져올 테이블: (테이블명, 인덱스) (원본 utils/fnguide.py)
+    main_table_selectors: tuple[tuple[str, int], ...] = (
         ("market_conditions", 0),
         ("earning_issue", 1),
         ("holdings_status", 2),
@@ -1169,46 +1738,10 @@ class FnGuideMain:
         ("industry_comparison", 8),
         ("financialhighlight_annual", 11),
         ("financialhighlight_netquarter", 12),
-    ]
-
-    # 한글 → 영문 컬럼명 매핑 딕셔너리
-    _COLUMN_MAP = {
-        "잠정실적발표예정일": "tentative_results_announcement_date",
-        "예상실적(영업이익, 억원)": "expected_operating_profit_billion_krw",
-        "3개월전예상실적대비(%)": "expected_operating_profit_vs_3m_pct",
-        "전년동기대비(%)": "year_over_year_pct",
-        "운용사명": "asset_manager_name",
-        "보유수량": "shares_held",
-        "시가평가액": "market_value_krw",
-        "상장주식수내비중": "share_of_outstanding_shares_pct",
-        "운용사내비중": "manager_portfolio_ratio_pct",
-        "항목": "item",
-        "보통주": "common_shares",
-        "지분율": "ownership_ratio_pct",
-        "최종변동일": "last_change_date",
-        "주주구분": "shareholder_category",
-        "대표주주수": "major_shareholder_count",
-        "투자의견": "investment_opinion",
-        "목표주가": "target_price",
-        "추정기관수": "estimate_institution_count",
-        "구분": "category",
-        "코스피 전기·전자": "kospi_electronics",
-        "헤더": "header",
-        "헤더.1": "header_1",
-        "IFRS(연결)": "ifrs_consolidated",
-        "IFRS(별도)": "ifrs_individual",
-    }
+    )
 
-    @property
-    @staticmethod
-    def main_table_selectors(self) -> List[Tuple[str, int]]:
-        """
-        Snapshot HTML에서 가져올 테이블 선택자
-
-        Returns:
-            List[Tuple[str, int]]: (테이블명, 인덱스) 튜플 리스트
-        """
-        return FnGuideMain._main_table_selectors
+    # 한글 → 영문 컬럼명 매핑 딕셔너리 (모듈 수준 _COLUMN_MAP)
+    _COLUMN_MAP = _COLUMN_MAP
 
     def parse(
         self,
@@ -1228,18 +1761,17 @@ class FnGuideMain:
         """
         
         datasets = {}
-        for name, index in FnGuideMain.main_table_selectors:
+        for name, index in self.main_table_selectors:
             if index < len(frames):
                 frame = frames[index]
                 # 한글 컬럼명을 영문으로 번역
                 frame = self._translate(
                     frame,
-                    stock=stock,
+                    stock_code=stock,
                 )
                 datasets[name] = frame.to_dict(orient="records")
             else:
-                #logger.error(f"경고: '{name}'에 해당하는 테이블(index {index})을 찾지 못해 빈 데이터로 저장합니다.")
-                print(f"경고: '{name}'에 해당하는 테이블(index {index})을 찾지 못해 빈 데이터로 저장합니다.")
+                logger.warning("'%s'에 해당하는 테이블(index %d)을 찾지 못해 빈 데이터로 저장합니다.", name, index)
                 datasets[name] = []
 
         return datasets
@@ -1253,10 +1785,11 @@ class FnGuideMain:
         """
         DataFrame의 한글 컬럼명을 영문으로 번역
 
-        단일 인덱스와 멀티 인덱스 모두 지원
+        단일 인덱스와 멀티 인덱스 모두 지원하며, 복사 없이 전달된 frame의 컬럼을 직접 바꾼다.
+        멀티 인덱스 컬럼은 레벨별로 번역한 뒤 " / "로 결합한 단일 문자열 키가 된다.
 
         Args:
-            frame: 번역할 DataFrame
+            frame: 번역할 DataFrame (컬럼이 변경됨)
             stock_code: 종목 코드 (회사명을 "company"로 치환하기 위해 사용)
 
         Returns:
@@ -1267,42 +1800,26 @@ class FnGuideMain:
 
         # 종목 코드로부터 회사명 조회
         company_name = None
-        if stock_code:
-            try:
-                from utils.companydict import companydict
-                company_name = companydict.get_company_by_code(stock_code)
-                if company_name:
-                    company_name = self._normalize(company_name)
-            except (ImportError, ModuleNotFoundError):
-                try:
-                    from ..companydict import companydict
-                    company_name = companydict.get_company_by_code(stock_code)
-                    if company_name:
-                        company_name = self._normalize(company_name)
-                except (ImportError, ModuleNotFoundError):
-                    pass
-
-        translated = frame.copy()
-
-        # 멀티인덱스 처리
-        if isinstance(translated.columns, pd.MultiIndex):
-            new_columns = []
-            for column in translated.columns:
-                # 각 레벨별로 번역
-                new_columns.append(
-                    tuple(self._translate_token(level, company_name) for level in column)
-                )
-            translated.columns = pd.MultiIndex.from_tuples(
-                new_columns, names=translated.columns.names
-            )
+        if stock_code and _companydict is not None:
+            company_name = _companydict.get_company_by_code(stock_code)
+            if company_name:
+                company_name = self._normalize(company_name)
+
+        # 파싱 직후 버려지는 임시 DataFrame이므로 복사하지 않고 컬럼만 교체
+        translate = self._translate_token
+
+        # 멀티인덱스 처리 (각 레벨별로 번역 후 " / "로 결합한 단일 키로 평탄화)
+        # 레코드/CSV에서는 어차피 단일 키로 쓰이므로 MultiIndex를 다시 만들지 않음
+        if isinstance(frame.columns, pd.MultiIndex):
+            frame.columns = [
+                _flatten_column_key(tuple(translate(level, company_name) for level in column))
+                for column in frame.columns
+            ]
         # 단일 인덱스 처리
         else:
-            translated.rename(
-                columns=lambda label: self._translate_token(label, company_name),
-                inplace=True,
-            )
+            frame.columns = [translate(label, company_name) for label in frame.columns]
 
-        return translated
+        return frame
 
     def _translate_token(self, label: str, company_name: str | None) -> str:
         """
@@ -1318,14 +1835,15 @@ class FnGuideMain:
         if not isinstance(label, str):
             return label
 
-        normalized = self._normalize(label)
+        # 대부분의 라벨에는 NBSP가 없으므로 그 경우 replace를 생략 (strip은 변경이 없으면 같은 객체 반환)
+        normalized = self._normalize(label) if "\xa0" in label else label.strip()
 
         # 회사명이면 "company"로 통일
         if company_name and normalized == company_name:
             return "company"
 
         # 매핑 딕셔너리에서 찾기 (없으면 원본 그대로)
-        return self._COLUMN_MAP.get(normalized, normalized)
+        return _COLUMN_MAP_GET(normalized, normalized)
 
     @staticmethod
     def _normalize(value: str) -> str:
@@ -1,36 +1,115 @@
+import heapq
+import io
+import itertools
 import logging
+import operator
 import os
-from datetime import datetime
+import uuid
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from google.cloud import storage, bigquery, exceptions, secretmanager
 
 
+# Secret Manager 조회 결과 캐시 유지 시간 (초)
+SECRET_CACHE_TTL = 600
+
+# GCP 서버리스 런타임(Cloud Run, App Engine, Cloud Functions)에서 설정되는 환경 변수
+_GCP_RUNTIME_ENV_VARS = ("K_SERVICE", "GAE_SERVICE", "GAE_ENV", "FUNCTION_TARGET")
+
+# _append_new_rows 스테이징 테이블 만료 시간 (삭제에 실패해도 BigQuery가 자동 정리)
+_STAGING_TABLE_TTL = timedelta(hours=1)
+
+# 메타데이터 서버 요청: 시도당 타임아웃은 짧게, 일시적 실패는 지수 백오프로 재시도
+# (최악의 경우 4회 × 0.5초 + 백오프 ≈ 2초 남짓)
+_METADATA_TIMEOUT = 0.5
+_METADATA_RETRY = Retry(
+    total=3,
+    backoff_factor=0.1,
+    backoff_jitter=0.05,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=("GET",),
+)
+
+
+@lru_cache(maxsize=1)
+def _metadata_session() -> requests.Session:
+    """재시도 정책이 적용된 메타데이터 서버용 세션 (프로세스당 하나)"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(max_retries=_METADATA_RETRY))
+    return session
+
+
+# 조회에 성공한 프로젝트 ID (실패 결과 None은 캐시하지 않아 다음 호출에서 다시 조회)
+_PROJECT_ID = None
+
+
 def get_gcp_project_id():
-    """GCP 메타데이터 서버 또는 환경 변수에서 프로젝트 ID를 가져옵니다."""
+    """환경 변수 또는 GCP 메타데이터 서버에서 프로젝트 ID를 가져옵니다 (성공한 결과만 프로세스에 캐시)."""
+    global _PROJECT_ID
+    if _PROJECT_ID is None:
+        _PROJECT_ID = _lookup_gcp_project_id()
+    return _PROJECT_ID
+
+
+def _lookup_gcp_project_id():
+    project_id = os.getenv("GCP_PROJECT_ID") or os.getenv("GOOGLE_CLOUD_PROJECT")
+    if project_id:
+        logging.info("환경 변수에서 프로젝트 ID를 가져왔습니다.")
+        return project_id
+
+    # GCP 런타임이 아니면 메타데이터 서버가 없으므로 타임아웃(2초)까지 기다리지 않음
+    if not any(os.getenv(name) for name in _GCP_RUNTIME_ENV_VARS):
+        logging.warning("GCP 런타임이 아니며 GCP_PROJECT_ID 환경 변수가 설정되지 않았습니다.")
+        return None
+
     try:
-        response = requests.get(
+        response = _metadata_session().get(
             "http://metadata.google.internal/computeMetadata/v1/project/project-id",
             headers={"Metadata-Flavor": "Google"},
-            timeout=2
+            timeout=_METADATA_TIMEOUT,
         )
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException:
-        project_id = os.getenv("GCP_PROJECT_ID")
-        if project_id:
-            logging.info("GCP_PROJECT_ID 환경 변수에서 프로젝트 ID를 가져왔습니다.")
-            return project_id
-        else:
-            logging.warning("GCP 메타데이터 서버에 연결할 수 없으며 GCP_PROJECT_ID 환경 변수가 설정되지 않았습니다.")
-            return None
+        logging.warning("GCP 메타데이터 서버에 연결할 수 없으며 GCP_PROJECT_ID 환경 변수가 설정되지 않았습니다.")
+        return None
+
+
+@lru_cache(maxsize=None)
+def _get_storage_client(project: str) -> storage.Client:
+    """프로젝트별 GCS 클라이언트 (모든 GCSManager가 연결 풀/인증 토큰 공유)"""
+    return storage.Client(project=project)
+
+
+@lru_cache(maxsize=None)
+def _get_bq_client(project: str) -> bigquery.Client:
+    """프로젝트별 BigQuery 클라이언트 (모든 BQManager가 공유)"""
+    return bigquery.Client(project=project)
+
+
+@lru_cache(maxsize=1)
+def _get_secret_client() -> secretmanager.SecretManagerServiceClient:
+    """Secret Manager 클라이언트 (모든 SecretManager가 공유)"""
+    return secretmanager.SecretManagerServiceClient()
+
 
 class SecretManager:
     """Google Secret Manager와 상호작용하기 위한 클라이언트"""
+    # (프로젝트, 시크릿, 버전) -> (값, 조회 시각) 캐시 (모든 인스턴스가 공유)
+    _cache: dict[tuple[str, str, str], tuple[str, float]] = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self, project_id: str | None = None):
         self.project_id = project_id or get_gcp_project_id()
         try:
-            self.client = secretmanager.SecretManagerServiceClient()
+            self.client = _get_secret_client()
             self._secret_manager_available = True
             logging.info("Secret Manager 클라이언트가 성공적으로 초기화되었습니다.")
         except Exception as e:
@@ -44,17 +123,32 @@ class SecretManager:
             logging.error("Secret Manager를 사용할 수 없거나 프로젝트 ID가 없습니다.")
             return None
             
+        key = (self.project_id, secret_id, version_id)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] < SECRET_CACHE_TTL:
+            return cached[0]
+
+        # 네트워크 호출 중에는 잠금을 잡지 않음 (다른 스레드가 막히지 않도록)
         name = f"projects/{self.project_id}/secrets/{secret_id}/versions/{version_id}"
         try:
             response = self.client.access_secret_version(request={"name": name})
-            return response.payload.data.decode("UTF-8")
+            value = response.payload.data.decode("UTF-8")
         except exceptions.NotFound:
             logging.error(f"시크릿 '{secret_id}'의 버전 '{version_id}'를 찾을 수 없습니다.")
             return None
         except Exception as e:
+            # 일시적인 오류면 만료된 캐시 값이라도 계속 사용
+            if cached is not None:
+                logging.warning(f"시크릿 '{secret_id}' 갱신 실패, 캐시된 값을 사용합니다: {e}")
+                return cached[0]
             logging.error(f"시크릿 '{secret_id}'에 접근하는 중 오류 발생: {e}")
             return None
 
+        with self._cache_lock:
+            self._cache[key] = (value, time.monotonic())
+        return value
+
     def load_secrets_into_env(self, secrets_to_load: list[str]):
         """Secret Manager에서 시크릿 목록을 가져와 환경 변수로 로드합니다."""
         if not self._secret_manager_available:
@@ -62,8 +156,15 @@ class SecretManager:
             return
 
         logging.info(f"시크릿 로드 중: {secrets_to_load}")
-        for secret_id in secrets_to_load:
-            secret_value = self.access_secret_version(secret_id)
+        if not secrets_to_load:
+            return
+
+        # 시크릿마다 gRPC 왕복이 필요하므로 동시에 조회 (클라이언트/채널은 스레드 간 공유)
+        with ThreadPoolExecutor(max_workers=min(16, len(secrets_to_load))) as executor:
+            secret_values = list(executor.map(self.access_secret_version, secrets_to_load))
+
+        # 환경 변수 설정은 순차적으로
+        for secret_id, secret_value in zip(secrets_to_load, secret_values):
             if secret_value is not None:
                 os.environ[secret_id] = secret_value
                 logging.info(f"시크릿 '{secret_id}'를 환경 변수로 로드했습니다.")
@@ -74,7 +175,7 @@ class GCSManager:
     def __init__(self, bucket_name="sayouzone-ai-stocks"):
         self.bucket_name = bucket_name
         try:
-            self.storage_client = storage.Client(project='sayonzone-ai')
+            self.storage_client = _get_storage_client('sayonzone-ai')
             self._storage_available = True
         except Exception as e:
             logging.warning("GCS client 초기화 실패: %s", e)
@@ -85,43 +186,77 @@ class GCSManager:
     def _normalize_blob_name(name: str) -> str:
         return name.lstrip("/")
 
-    def list_files(self, folder_name=None, sort_by_time=True):
+    def _iter_blobs(self, folder_name=None, *, fields: str, page_size: int = 1000):
+        """폴더('/' 유무 두 가지 prefix)의 blob을 페이지가 도착하는 대로 하나씩 돌려줍니다."""
+        prefixes: list[str | None]
+        if folder_name:
+            normalized = self._normalize_blob_name(folder_name)
+            prefixes = [folder_name]
+            # 예전 업로드로 '/'로 시작하는 blob이 남아 있을 수 있어 두 prefix 모두 조회
+            # ('/'로 시작하는 prefix와 아닌 prefix의 결과는 겹치지 않으므로 중복 제거 불필요)
+            if normalized and normalized != folder_name:
+                prefixes.append(normalized)
+        else:
+            prefixes = [None]
+
+        for prefix in prefixes:
+            kwargs = {"prefix": prefix} if prefix else {}
+            yield from self.storage_client.list_blobs(
+                self.bucket_name,
+                fields=fields,
+                page_size=page_size,
+                **kwargs,
+            )
+
+    def iter_files(self, folder_name=None, *, limit: int | None = None, page_size: int = 1000):
+        """파일 이름을 목록 전체를 모으지 않고 페이지 단위로 바로 돌려줍니다 (정렬 없음)."""
+        if not getattr(self, "_storage_available", False):
+            print("GCS 클라이언트가 비활성화되어 목록을 가져올 수 없습니다.")
+            return
+        # 이름만 받도록 응답 필드를 제한해 LIST 응답 크기를 줄임
+        blobs = self._iter_blobs(folder_name, fields="items(name),nextPageToken", page_size=page_size)
+        for blob in itertools.islice(blobs, limit):
+            yield blob.name
+
+    def list_files(self, folder_name=None, sort_by_time=True, *, max_results: int | None = None, page_size: int = 1000):
         print(f"'{folder_name if folder_name else '전체'}' 구역의 파일 목록 조회를 시작합니다...")
         if not getattr(self, "_storage_available", False):
             print("GCS 클라이언트가 비활성화되어 목록을 가져올 수 없습니다.")
             return []
         try:
-            prefixes: list[str | None]
-            if folder_name:
-                normalized = self._normalize_blob_name(folder_name)
-                prefixes = [folder_name]
-                if normalized and normalized != folder_name:
-                    prefixes.append(normalized)
+            if sort_by_time:
+                # 정렬용 생성 시각만 추가로 받음
+                blobs = self._iter_blobs(
+                    folder_name,
+                    fields="items(name,timeCreated),nextPageToken",
+                    page_size=page_size,
+                )
+                by_time = operator.attrgetter("time_created")
+                if max_results is None:
+                    blob_list = sorted(blobs, key=by_time, reverse=True)
+                else:
+                    # 최신 max_results개만 유지 (전체 목록을 메모리에 올리지 않음)
+                    blob_list = heapq.nlargest(max_results, blobs, key=by_time)
+                file_list = [blob.name for blob in blob_list]
             else:
-                prefixes = [None]
-
-            seen: set[str] = set()
-            blob_list: list = []
-            for prefix in prefixes:
-                kwargs = {"prefix": prefix} if prefix else {}
-                blobs = self.storage_client.list_blobs(self.bucket_name, **kwargs)
-                for blob in blobs:
-                    if blob.name in seen:
-                        continue
-                    seen.add(blob.name)
-                    blob_list.append(blob)
-
-            if sort_by_time and blob_list:
-                blob_list.sort(key=lambda blob: blob.time_created, reverse=True)
-
-            file_list = [blob.name for blob in blob_list]
+                file_list = list(self.iter_files(folder_name, limit=max_results, page_size=page_size))
+
             print(f"총 {len(file_list)}개의 파일을 찾았습니다.")
             return file_list
         except Exception as e:
             print(f"파일 목록 조회 중 심각한 에러 발생: {e}")
             return []
 
-    def upload_file(self, source_file, destination_blob_name, *, encoding: str = "utf-8", content_type: str | None = None):
+    def upload_file(
+        self,
+        source_file,
+        destination_blob_name,
+        *,
+        encoding: str = "utf-8",
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        chunk_size: int = 8 * 1024 * 1024,
+    ):
         normalized_name = self._normalize_blob_name(destination_blob_name)
         if not normalized_name:
             normalized_name = destination_blob_name
@@ -133,28 +268,27 @@ class GCSManager:
             bucket = self.storage_client.bucket(self.bucket_name)
             blob = bucket.blob(normalized_name)
 
+            # content_encoding="gzip"이면 압축된 payload를 그대로 저장 (읽을 때 GCS가 압축 해제해 전달)
+            if content_encoding:
+                blob.content_encoding = content_encoding
+            upload_kwargs = {"content_type": content_type} if content_type else {}
+
             if isinstance(source_file, str):
-                payload = source_file.encode(encoding)
-            elif isinstance(source_file, (bytes, bytearray)):
-                payload = bytes(source_file)
+                blob.upload_from_string(source_file.encode(encoding), **upload_kwargs)
+            elif isinstance(source_file, bytes):
+                blob.upload_from_string(source_file, **upload_kwargs)
+            elif isinstance(source_file, (bytearray, memoryview)):
+                blob.upload_from_string(bytes(source_file), **upload_kwargs)
+            elif isinstance(source_file, io.TextIOBase):
+                # 텍스트 스트림은 바이트로 인코딩해야 하므로 읽어서 업로드
+                blob.upload_from_string(source_file.read().encode(encoding), **upload_kwargs)
             elif hasattr(source_file, "read"):
-                data = source_file.read()
-                if isinstance(data, str):
-                    payload = data.encode(encoding)
-                elif isinstance(data, (bytes, bytearray)):
-                    payload = bytes(data)
-                else:
-                    raise TypeError("Unsupported stream data type for upload")
+                # 바이너리 스트림은 전체를 메모리에 올리지 않고 chunk_size 단위로 resumable 업로드
+                blob.chunk_size = chunk_size
+                blob.upload_from_file(source_file, **upload_kwargs)
             else:
                 raise TypeError("source_file must be a str, bytes-like, or readable object")
 
-            upload_kwargs = {"content_type": content_type} if content_type else {}
-            blob.upload_from_string(payload, **upload_kwargs)
-            try:
-                blob.reload()
-            except Exception:
-                pass
-
             print("파일 업로드 성공!")
             return True
         except FileNotFoundError:
@@ -164,6 +298,43 @@ class GCSManager:
             print(f"파일 업로드 중 심각한 에러 발생: {e}")
             return False
     
+    def upload_stream(
+        self,
+        df: pd.DataFrame,
+        destination_blob_name,
+        *,
+        content_type: str = "text/csv",
+        encoding: str = "utf-8",
+        chunk_size: int = 8 * 1024 * 1024,
+    ):
+        """DataFrame을 CSV 문자열로 만들지 않고 GCS 업로드 스트림에 바로 기록합니다."""
+        normalized_name = self._normalize_blob_name(destination_blob_name)
+        if not normalized_name:
+            normalized_name = destination_blob_name
+        print(f"파일 스트리밍 업로드 시작: '{normalized_name}'")
+        if not getattr(self, "_storage_available", False):
+            print("GCS 클라이언트가 비활성화되어 업로드를 수행할 수 없습니다.")
+            return False
+        try:
+            bucket = self.storage_client.bucket(self.bucket_name)
+            blob = bucket.blob(normalized_name)
+
+            # chunk_size 단위로 resumable upload를 진행하므로 직렬화와 전송이 겹친다
+            with blob.open(
+                "w",
+                encoding=encoding,
+                newline="",
+                chunk_size=chunk_size,
+                content_type=content_type,
+            ) as stream:
+                df.to_csv(stream, index=False)
+
+            print("파일 업로드 성공!")
+            return True
+        except Exception as e:
+            print(f"파일 업로드 중 심각한 에러 발생: {e}")
+            return False
+
     def read_file(self, blob_name):
         print(f"파일 읽기 시작: '{blob_name}'")
         if not getattr(self, "_storage_available", False):
@@ -190,6 +361,61 @@ class GCSManager:
             print(f"파일 읽기 중 심각한 에러 발생: {e}")
             return None
 
+    def read_bytes(self, blob_name) -> bytes | None:
+        """blob 내용을 디코딩하지 않고 bytes로 읽습니다 (압축된 캐시 등)."""
+        print(f"파일 읽기 시작: '{blob_name}'")
+        if not getattr(self, "_storage_available", False):
+            print("GCS 클라이언트가 비활성화되어 파일을 읽을 수 없습니다.")
+            return None
+        try:
+            bucket = self.storage_client.bucket(self.bucket_name)
+            candidate_names = [blob_name]
+            normalized = self._normalize_blob_name(blob_name)
+            if normalized and normalized != blob_name:
+                candidate_names.append(normalized)
+
+            for name in candidate_names:
+                try:
+                    content = bucket.blob(name).download_as_bytes()
+                    print("파일 읽기 성공!")
+                    return content
+                except Exception:
+                    continue
+            print("파일 읽기 실패: 지정된 경로에서 파일을 찾을 수 없습니다.")
+            return None
+        except Exception as e:
+            print(f"파일 읽기 중 심각한 에러 발생: {e}")
+            return None
+
+    def open_file(self, blob_name):
+        """blob을 한 번에 내려받지 않고 바이너리 읽기 스트림으로 엽니다 (gzip 인코딩은 해제하지 않음)."""
+        print(f"파일 스트림 열기 시작: '{blob_name}'")
+        if not getattr(self, "_storage_available", False):
+            print("GCS 클라이언트가 비활성화되어 파일을 읽을 수 없습니다.")
+            return None
+        try:
+            bucket = self.storage_client.bucket(self.bucket_name)
+            candidate_names = [blob_name]
+            normalized = self._normalize_blob_name(blob_name)
+            if normalized and normalized != blob_name:
+                candidate_names.append(normalized)
+
+            for name in candidate_names:
+                try:
+                    reader = bucket.blob(name).open("rb", raw_download=True)
+                    # 첫 청크를 읽어 blob 존재 여부 확인 (이후 읽기는 버퍼에서 이어짐)
+                    reader.read(1)
+                    reader.seek(0)
+                    print("파일 스트림 열기 성공!")
+                    return reader
+                except Exception:
+                    continue
+            print("파일 스트림 열기 실패: 지정된 경로에서 파일을 찾을 수 없습니다.")
+            return None
+        except Exception as e:
+            print(f"파일 스트림 열기 중 심각한 에러 발생: {e}")
+            return None
+
     def ensure_folder(self, folder_name: str) -> bool:
         if not folder_name:
             return True
@@ -224,7 +450,7 @@ class BQManager:
         self.project_id = project_id
         self.dataset_id = "stocks"
         try:
-            self.bq_client = bigquery.Client(project=project_id)
+            self.bq_client = _get_bq_client(project_id)
         except Exception as e:
             logging.warning("BigQuery 클라이언트 초기화 실패: %s", e)
             self.bq_client = None
@@ -254,38 +480,39 @@ class BQManager:
             print(f"Dataset 검사 중 오류 발생: {e}")
             return False
 
-    def query_table(self, table_id: str, start_date: str | None = None, end_date: str | None = None, order_by_date: bool = True) -> pd.DataFrame | None:
+    def query_table(
+        self,
+        table_id: str,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        order_by_date: bool = True,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
         """
         Queries a table with optional date filtering and ordering.
+        Date bounds are passed as query parameters; pass `columns` to read only those columns.
         Returns a DataFrame or None if the table doesn't exist or an error occurs.
         """
         if not self.bq_client:
             print("BigQuery 클라이언트가 비활성화되어 쿼리를 수행할 수 없습니다.")
             return None
-        if '.' not in table_id:
-            full_table_id = f"{self.project_id}.{self.dataset_id}.{table_id}"
-        else:
-            full_table_id = table_id
+        full_table_id = self._full_table_id(table_id)
 
         print(f"Querying BigQuery table: '{full_table_id}'...")
 
-        try:
-            self.bq_client.get_table(full_table_id)
-        except exceptions.NotFound:
-            print(f"Table '{full_table_id}' does not exist. Skipping query.")
-            return None
-        except Exception as e:
-            print(f"Error checking table existence: {e}")
-            return None
+        select_list = ", ".join(f"`{col}`" for col in columns) if columns else "*"
+        query = f"SELECT {select_list} FROM `{full_table_id}`"
 
-        query = f"SELECT * FROM `{full_table_id}`"
-        
+        # STRING 파라미터는 date 컬럼 타입(DATE/TIMESTAMP/STRING)에 맞게 변환되므로 기존 리터럴 비교와 동일
         where_clauses = []
+        query_parameters = []
         if start_date:
-            where_clauses.append(f"date >= '{start_date}'")
+            where_clauses.append("date >= @start_date")
+            query_parameters.append(bigquery.ScalarQueryParameter("start_date", "STRING", start_date))
         if end_date:
-            where_clauses.append(f"date <= '{end_date}'")
-        
+            where_clauses.append("date <= @end_date")
+            query_parameters.append(bigquery.ScalarQueryParameter("end_date", "STRING", end_date))
+
         if where_clauses:
             query += " WHERE " + " AND ".join(where_clauses)
             
@@ -295,12 +522,20 @@ class BQManager:
         print(f"Executing query: {query}")
 
         try:
-            df = self.bq_client.query(query).to_dataframe()
+            job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+            # 결과는 BigQuery Storage API(Arrow)로 내려받음 (REST JSON 페이징보다 빠름)
+            df = self.bq_client.query(query, job_config=job_config).to_dataframe(
+                create_bqstorage_client=True
+            )
             if df.empty:
                 print("Query returned no data.")
                 return None
             print(f"Successfully queried {len(df)} rows.")
             return df
+        except exceptions.NotFound:
+            # 테이블이 없으면 쿼리 자체가 NotFound로 실패하므로 별도 존재 확인 요청 없이 처리
+            print(f"Table '{full_table_id}' does not exist. Skipping query.")
+            return None
         except Exception as e:
             print(f"Error querying BigQuery: {e}")
             return None
@@ -342,41 +577,31 @@ class BQManager:
         print(f"Loading dataframe into BigQuery table: '{full_table_id}'...")
 
         try:
-            self.bq_client.get_table(full_table_id)
-            table_exists = True
+            target_table = self.bq_client.get_table(full_table_id)
         except exceptions.NotFound:
-            table_exists = False
+            target_table = None
 
-        if table_exists and deduplicate_on and if_exists == "append":
+        if target_table is not None and deduplicate_on and if_exists == "append":
             if df.empty:
                 print("Dataframe is empty. Skipping load.")
                 return True
-            
-            key_cols = ", ".join(deduplicate_on)
-            duplication_query = f"SELECT DISTINCT {key_cols} FROM `{full_table_id}`"
 
-            print("Querying existing data for deduplication...")
+            print("Deduplicating against existing data in BigQuery...")
             try:
-                query_job = self.bq_client.query(duplication_query)
-                existing_data_keys = {tuple(row.values()) for row in query_job.result()}
-                print(f"Found {len(existing_data_keys)} unique keys in existing data.")
-
-                df_keys = df[deduplicate_on].apply(tuple, axis=1)
-                fresh_data_mask = ~df_keys.isin(existing_data_keys)
-                df_to_load = df[fresh_data_mask]
-
-                if df_to_load.empty:
-                    print("No new data to load after deduplication. Skipping load.")
-                    return True
-                
-                print(f"{len(df_to_load)} new rows remaining after deduplication. Proceeding to load...")
-                df = df_to_load
+                return self._append_new_rows(df, target_table, deduplicate_on)
             except Exception as e:
                 print(f"Error during deduplication query: {e}. Skipping deduplication.")
 
         try:
+            # 이어 붙일 때는 기존 테이블 스키마를 그대로 사용 (서버 측 스키마 추론 생략)
+            # 새 컬럼과 새 테이블은 DataFrame dtype으로부터 스키마를 만들어 Parquet으로 전송
+            known_schema = None
+            if target_table is not None and if_exists != "replace":
+                known_schema = [field for field in target_table.schema if field.name in df.columns] or None
+
             job_config = bigquery.LoadJobConfig(
-                autodetect=True,
+                source_format=bigquery.SourceFormat.PARQUET,
+                schema=known_schema,
                 write_disposition=(
                     bigquery.WriteDisposition.WRITE_TRUNCATE if if_exists == "replace" 
                     else bigquery.WriteDisposition.WRITE_APPEND
@@ -398,6 +623,60 @@ class BQManager:
             print(f"Failed to load dataframe: {e}")
             return False
 
+    def _append_new_rows(self, df: pd.DataFrame, target_table, deduplicate_on: list) -> bool:
+        """
+        Appends only rows whose keys are not already in the target table.
+
+        The DataFrame is staged into a temporary table and the anti-join runs in BigQuery,
+        so existing keys never leave the warehouse.
+        """
+        full_table_id = f"{target_table.project}.{target_table.dataset_id}.{target_table.table_id}"
+        staging_table_id = f"{full_table_id}_stg_{uuid.uuid4().hex}"
+
+        # Reuse the target column types where they overlap so the comparison and append line up
+        staging_schema = [field for field in target_table.schema if field.name in df.columns]
+        staging_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            schema=staging_schema or None,
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+        )
+
+        try:
+            # Create the staging table with an expiration first so it cannot outlive a crashed run
+            staging_table = bigquery.Table(staging_table_id, schema=staging_schema or None)
+            staging_table.expires = datetime.now(timezone.utc) + _STAGING_TABLE_TTL
+            self.bq_client.create_table(staging_table)
+
+            self.bq_client.load_table_from_dataframe(
+                dataframe=df, destination=staging_table_id, job_config=staging_config
+            ).result()
+
+            key_match = " AND ".join(
+                f"t.`{col}` IS NOT DISTINCT FROM s.`{col}`" for col in deduplicate_on
+            )
+            query = (
+                f"SELECT s.* FROM `{staging_table_id}` AS s "
+                f"WHERE NOT EXISTS (SELECT 1 FROM `{full_table_id}` AS t WHERE {key_match})"
+            )
+            query_config = bigquery.QueryJobConfig(
+                destination=full_table_id,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+                schema_update_options=[bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION],
+            )
+            inserted = self.bq_client.query(query, job_config=query_config).result().total_rows
+
+            if not inserted:
+                print("No new data to load after deduplication. Skipping load.")
+            else:
+                print(f"{inserted} new rows loaded into '{full_table_id}' after deduplication.")
+            return True
+        finally:
+            # A cleanup failure must not turn a finished append into a failure (and a duplicate reload)
+            try:
+                self.bq_client.delete_table(staging_table_id, not_found_ok=True)
+            except Exception as e:
+                print(f"Failed to delete staging table '{staging_table_id}': {e}")
+
     def create_external_table(self):
         if not self.bq_client:
             print("BigQuery 클라이언트가 비활성화되어 테이블을 생성하지 않습니다.")
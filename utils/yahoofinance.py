@@ -1,11 +1,11 @@
 import os
-import json
+import orjson
 import yfinance as yf
+import zstandard
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Literal, Tuple
 from utils.companydict import companydict as find
@@ -16,6 +16,82 @@ import asyncio
 from typing import AsyncGenerator, Dict, Any
 import re
 
+logger = logging.getLogger(__name__)
+
+
+def _iso_value(value: Any) -> Any:
+    """Timestamp/datetime은 ISO 문자열로, NaN/NaT는 None으로 변환합니다."""
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.isoformat() if pd.notna(value) else None
+    if value is pd.NaT or (isinstance(value, float) and value != value):
+        return None
+    return value
+
+
+def dataframe_to_records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """
+    DataFrame을 JSON 호환 레코드 리스트로 변환합니다.
+
+    json.loads(frame.to_json(orient="records", date_format="iso"))와 같은 결과를
+    JSON 문자열 인코딩/디코딩 왕복 없이 만듭니다 (인덱스는 포함하지 않음).
+
+    Args:
+        frame: 변환할 DataFrame
+
+    Returns:
+        list[dict]: 레코드 리스트 (날짜는 ISO 문자열, 결측값은 None)
+    """
+    records = frame.astype(object)
+    for column in frame.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        records.loc[:, column] = [_iso_value(value) for value in frame[column]]
+    records = records.where(frame.notna(), None)
+    records.columns = [_iso_value(column) for column in frame.columns]
+    return records.to_dict(orient="records")
+
+
+def series_to_dict(series: pd.Series) -> dict[Any, Any]:
+    """
+    Series를 JSON 호환 딕셔너리로 변환합니다 (날짜 키/값은 ISO 문자열, 결측값은 None).
+
+    Args:
+        series: 변환할 Series
+
+    Returns:
+        dict: {인덱스: 값}
+    """
+    return {_iso_value(key): _iso_value(value) for key, value in series.items()}
+
+
+def _json_default(value: Any) -> Any:
+    """orjson이 직접 처리하지 못하는 값 변환 (pd.NA 등 결측값은 None)"""
+    return None if pd.isna(value) else str(value)
+
+
+def statement_to_json(frame: pd.DataFrame) -> str:
+    """
+    재무제표 DataFrame을 {기간: {항목: 값}} 형태의 JSON 문자열로 변환합니다.
+
+    DataFrame.to_json(orient="columns", date_format="iso")와 같은 구조를
+    pandas JSON 인코더 없이 열 단위 리스트와 orjson으로 만듭니다.
+
+    Args:
+        frame: yfinance 재무제표 DataFrame (인덱스: 항목, 컬럼: 기간)
+
+    Returns:
+        str: JSON 문자열 (기간은 ISO 문자열, 결측값은 null)
+    """
+    index = [_iso_value(label) for label in frame.index]
+    payload = {
+        _iso_value(column): dict(zip(index, values.tolist()))
+        for column, values in frame.items()
+    }
+    return orjson.dumps(
+        payload,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        default=_json_default,
+    ).decode("utf-8")
+
+
 class News:
     def __init__(self):
         self.bq_manager = BQManager()
@@ -317,6 +393,8 @@ class Fundamentals:
     GCS 캐싱 기능은 유지하여 API 호출 비용을 최소화.
     """
     GCS_CACHE_PREFIX = "yahoofinance_fundamentals_cache"
+    # 재무제표 JSON은 반복되는 키가 많아 zstd로 압축해 저장 (전송량/캐시 조회 시간 감소)
+    GCS_CACHE_LEVEL = 3
 
     def __init__(self):
         self.gcs_manager = GCSManager()
@@ -361,9 +439,9 @@ class Fundamentals:
             if hasattr(ticker, attribute_name_str):
                 data = getattr(ticker, attribute_name_str)
                 if isinstance(data, pd.DataFrame):
-                    return json.loads(data.to_json(orient="records", date_format="iso"))
+                    return dataframe_to_records(data)
                 if isinstance(data, pd.Series):
-                    return data.to_dict()
+                    return series_to_dict(data)
                 if isinstance(data, dict):
                     return data
                 return data
@@ -371,29 +449,51 @@ class Fundamentals:
                 raise ValueError(f"'{attribute_name_str}' is not a valid yfinance Ticker attribute.")
 
         # --- 재무제표 3종 수집 (MCP 도구 버전 로직) ---
-        gcs_blob_name = f"{self.GCS_CACHE_PREFIX}/{ticker_symbol}.json"
+        legacy_blob_name = f"{self.GCS_CACHE_PREFIX}/{ticker_symbol}.json"
+        gcs_blob_name = f"{legacy_blob_name}.zst"
 
-        # 캐시 확인
+        # 캐시 확인 (zstd 압축 캐시 → 기존 비압축 JSON 캐시 순)
         if use_cache and not overwrite:
-            cached_payload = self.gcs_manager.read_file(gcs_blob_name)
-            if cached_payload:
-                try:
-                    payload = json.loads(cached_payload)
-                    logging.info(f"Returning cached fundamentals for {ticker_symbol} from GCS: {gcs_blob_name}")
+            cached_payload = self.gcs_manager.read_bytes(gcs_blob_name)
+            blob_name = gcs_blob_name
+            try:
+                if cached_payload:
+                    cached_payload = zstandard.decompress(cached_payload)
+                else:
+                    cached_payload = self.gcs_manager.read_bytes(legacy_blob_name)
+                    blob_name = legacy_blob_name
+                if cached_payload:
+                    payload = orjson.loads(cached_payload)
+                    logger.info(f"Returning cached fundamentals for {ticker_symbol} from GCS: {blob_name}")
                     return payload
-                except (json.JSONDecodeError, KeyError) as e:
-                    logging.warning(f"GCS cache read failed for {ticker_symbol} (corrupted JSON): {e}. Refetching.")
+            except (zstandard.ZstdError, orjson.JSONDecodeError, KeyError) as e:
+                logger.warning(f"GCS cache read failed for {ticker_symbol} (corrupted cache): {e}. Refetching.")
 
         # yfinance Ticker 객체 생성
         ticker = yf.Ticker(ticker_symbol)
 
-        # 국가 정보 추론
-        country = "Unknown"
-        try:
-            info = ticker.info or {}
-            country = info.get("country") or "Unknown"
-        except Exception as e:
-            logging.warning(f"Failed to fetch ticker info for {ticker_symbol}: {e}")
+        # 재무제표 3종은 서로 독립적인 요청이므로 스레드 풀에서 동시에 수집
+        # (result 키, yfinance attribute)
+        statements = [
+            ("balance_sheet", "balance_sheet"),      # 1. Balance Sheet (재무상태표)
+            ("income_statement", "income_stmt"),     # 2. Income Statement (손익계산서)
+            ("cash_flow", "cashflow"),               # 3. Cash Flow (현금흐름표)
+        ]
+        with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+            futures = {
+                key: executor.submit(self._fetch_statement, ticker, ticker_symbol, attribute)
+                for key, attribute in statements
+            }
+
+            # 국가 정보 추론 (재무제표 수집과 동시에 진행)
+            country = "Unknown"
+            try:
+                info = ticker.info or {}
+                country = info.get("country") or "Unknown"
+            except Exception as e:
+                logger.warning(f"Failed to fetch ticker info for {ticker_symbol}: {e}")
+
+            statement_json = {key: future.result() for key, future in futures.items()}
 
         # 한국 종목 코드 패턴 확인
         if ".KS" in ticker_symbol or ".KQ" in ticker_symbol:
@@ -401,54 +501,86 @@ class Fundamentals:
         elif ticker_symbol.replace(".KS", "").replace(".KQ", "").isdigit() and len(ticker_symbol.replace(".KS", "").replace(".KQ", "")) == 6:
             country = "KR"
 
-        # 재무제표 3종 수집
+        # 재무제표 3종 결과 구성
         result = {
             "ticker": ticker_symbol,
             "country": country,
-            "balance_sheet": None,
-            "income_statement": None,
-            "cash_flow": None
+            "balance_sheet": statement_json["balance_sheet"],
+            "income_statement": statement_json["income_statement"],
+            "cash_flow": statement_json["cash_flow"]
         }
 
-        # 1. Balance Sheet (재무상태표)
-        try:
-            balance_sheet = ticker.balance_sheet
-            if balance_sheet is not None and not balance_sheet.empty:
-                result["balance_sheet"] = balance_sheet.to_json(orient="columns", date_format="iso")
-        except Exception as e:
-            logging.warning(f"Failed to fetch balance_sheet for {ticker_symbol}: {e}")
-
-        # 2. Income Statement (손익계산서)
-        try:
-            income_stmt = ticker.income_stmt
-            if income_stmt is not None and not income_stmt.empty:
-                result["income_statement"] = income_stmt.to_json(orient="columns", date_format="iso")
-        except Exception as e:
-            logging.warning(f"Failed to fetch income_stmt for {ticker_symbol}: {e}")
-
-        # 3. Cash Flow (현금흐름표)
-        try:
-            cashflow = ticker.cashflow
-            if cashflow is not None and not cashflow.empty:
-                result["cash_flow"] = cashflow.to_json(orient="columns", date_format="iso")
-        except Exception as e:
-            logging.warning(f"Failed to fetch cashflow for {ticker_symbol}: {e}")
-
         # GCS에 캐시 저장
         try:
-            payload_json = json.dumps(result, ensure_ascii=False, indent=2)
+            payload = zstandard.compress(orjson.dumps(result), self.GCS_CACHE_LEVEL)
             self.gcs_manager.upload_file(
-                source_file=payload_json,
+                source_file=payload,
                 destination_blob_name=gcs_blob_name,
-                encoding="utf-8",
-                content_type="application/json; charset=utf-8",
+                content_type="application/zstd",
             )
-            logging.info(f"Successfully cached fundamentals for {ticker_symbol} to GCS: {gcs_blob_name}")
+            logger.info(f"Successfully cached fundamentals for {ticker_symbol} to GCS: {gcs_blob_name}")
         except Exception as e:
-            logging.error(f"GCS cache write failed for {ticker_symbol}: {e}")
+            logger.error(f"GCS cache write failed for {ticker_symbol}: {e}")
 
         return result
 
+    @staticmethod
+    def _fetch_statement(ticker: yf.Ticker, ticker_symbol: str, attribute: str) -> str | None:
+        """
+        yfinance 재무제표 하나를 JSON 문자열로 가져옵니다.
+
+        Args:
+            ticker: yfinance Ticker 객체
+            ticker_symbol: 로그용 티커
+            attribute: yfinance Ticker attribute (예: 'balance_sheet', 'income_stmt', 'cashflow')
+
+        Returns:
+            str | None: 재무제표 JSON 문자열 (데이터가 없거나 실패하면 None)
+        """
+        try:
+            statement = getattr(ticker, attribute)
+            if statement is not None and not statement.empty:
+                return statement_to_json(statement)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {attribute} for {ticker_symbol}: {e}")
+        return None
+
+    def fundamentals_batch(
+        self,
+        symbols: list[str],
+        *,
+        use_cache: bool = True,
+        max_workers: int = 8
+    ) -> dict[str, dict[str, object]]:
+        """
+        여러 종목의 재무제표 3종을 한 번에 수집합니다.
+
+        Yahoo Finance 재무제표는 종목별로 따로 조회해야 하므로,
+        종목별 fundamentals() 호출을 스레드 풀에서 동시에 실행합니다.
+
+        Args:
+            symbols: Yahoo Finance 티커 리스트 (예: ['AAPL', 'MSFT'])
+            use_cache: GCS 캐시 사용 여부
+            max_workers: 동시에 조회할 최대 종목 수
+
+        Returns:
+            dict: {티커: fundamentals() 결과 또는 {"ticker": str, "error": str}}
+        """
+        def fetch(symbol: str) -> dict[str, object]:
+            try:
+                return self.fundamentals(query=symbol, use_cache=use_cache)
+            except Exception as e:
+                logger.warning(f"Failed to fetch fundamentals for {symbol}: {e}")
+                return {"ticker": symbol, "error": str(e)}
+
+        if not symbols:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+            results = list(executor.map(fetch, symbols))
+
+        return dict(zip(symbols, results))
+
 
 async def _collect_ticker_metadata(ticker: yf.Ticker, fallback: Dict[str, Any]) -> Dict[str, Any]:
     metadata: Dict[str, Any] = dict(fallback)
@@ -460,12 +592,12 @@ async def _collect_ticker_metadata(ticker: yf.Ticker, fallback: Dict[str, Any])
     try:
         info = await asyncio.to_thread(ticker.get_info)
     except Exception as exc:
-        logging.warning("Failed to fetch ticker info for %s: %s", symbol, exc)
+        logger.warning("Failed to fetch ticker info for %s: %s", symbol, exc)
 
     try:
         fast_info = await asyncio.to_thread(lambda: ticker.fast_info)
     except Exception as exc:
-        logging.warning("Failed to fetch fast info for %s: %s", symbol, exc)
+        logger.warning("Failed to fetch fast info for %s: %s", symbol, exc)
         fast_info = {}
 
     metadata["company_name"] = (